@@ -1,5 +1,6 @@
 import asyncio
 import os
+from contextlib import asynccontextmanager
 from multiprocessing.pool import Pool, ThreadPool
 from pathlib import Path
 from typing import Literal
@@ -9,6 +10,7 @@ from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from fastapi import APIRouter, FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 import pytz
 from app.src import definition
@@ -16,21 +18,16 @@ from app.src import definition
 from app.src.modules import hketa
 from app.src.routers import eta, icon, route
 
-
-app = FastAPI(title="HKETA-API-Server")
-
-app.mount("/static", StaticFiles(directory=os.path.join(
-    os.path.dirname(os.path.dirname(__file__)), "static")), name="static")
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    # uvloop is not available on Windows
+    pass
 
 
 # initialisation
-scheduler = None
-
-
-@app.on_event("startup")
-async def init_scheduler():
-    global scheduler
-
+def init_scheduler() -> BackgroundScheduler:
     scheduler = BackgroundScheduler(
         jobstores={
             'default': MemoryJobStore(),
@@ -47,13 +44,13 @@ async def init_scheduler():
     def fetch_raw_dataset_mtrb_job():
         p = (hketa.predictor.MtrBusPredictor(definition.DATASET_PATH,
                                              definition.ETA_FACTORY.create_transport(hketa.enums.Transport.MTRBUS)))
-        asyncio.run(p.fetch_dataset())
+        hketa.api.run(p.fetch_dataset())
 
     @scheduler.scheduled_job(trigger='cron', minute='*/1', second='10', max_instances=1)
     def fetch_raw_dataset_kmb_job():
         p = hketa.predictor.KmbPredictor(definition.DATASET_PATH,
                                          definition.ETA_FACTORY.create_transport(hketa.enums.Transport.KMB))
-        asyncio.run(p.fetch_dataset())
+        hketa.api.run(p.fetch_dataset())
 
     @scheduler.scheduled_job(trigger='cron', args=['day'], hour='3', minute='0', max_instances=1)
     @scheduler.scheduled_job(trigger='cron', args=['night'], hour='15', minute='0', max_instances=1)
@@ -70,11 +67,26 @@ async def init_scheduler():
             .raws_to_ml_dataset(type_)
 
     scheduler.start()
+    return scheduler
 
 
-@app.on_event("shutdown")
-def shutdown_scheduler():
+@asynccontextmanager
+async def lifespan(app_: FastAPI):
+    scheduler = init_scheduler()
+    # open the shared session of the server's event loop up front, its
+    # connections are reused by the requests of every company
+    hketa.api.get_session()
+    yield
     scheduler.shutdown(wait=False)
+    await hketa.api.close_session()
+
+
+app = FastAPI(title="HKETA-API-Server",
+              default_response_class=ORJSONResponse,
+              lifespan=lifespan)
+
+app.mount("/static", StaticFiles(directory=os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "static")), name="static")
 
 
 app.include_router(eta.router)
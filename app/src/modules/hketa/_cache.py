@@ -0,0 +1,278 @@
+"""Data file format and in-memory caches shared by the `Transport`s"""
+
+import asyncio
+import csv
+import mmap
+import os
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict, defaultdict
+from datetime import datetime, timezone
+from operator import itemgetter
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+import aiofiles
+import aiohttp
+import msgspec
+
+ENCODER = msgspec.msgpack.Encoder()
+DECODER = msgspec.msgpack.Decoder()
+
+
+class StalenessProbe(msgspec.Struct):
+    """Header frame of a data file"""
+
+    last_update: str
+    """ISO-8601 datetime of the data being fetched"""
+
+
+_PROBE_DECODER = msgspec.msgpack.Decoder(StalenessProbe)
+_PROBE_READ_SIZE = 64
+"""Number of bytes read to decode the header frame in a single read"""
+
+
+def frame(payload: bytes) -> bytes:
+    """Prefix `payload` with its 4-byte big-endian length."""
+    return len(payload).to_bytes(4, 'big') + payload
+
+
+def write_payload(path: os.PathLike, payload: bytes) -> None:
+    """Atomically replace the file at `path` with `payload`.
+
+    `payload` is written to a temporary file next to `path`, flushed to
+    disk and renamed over `path`, so that a crash never leaves a partially
+    written file behind. Each write has its own temporary file, so that
+    concurrent writers of the same `path` do not clobber each other.
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path),
+                               prefix=f"{os.path.basename(path)}.",
+                               suffix=".tmp")
+    try:
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            # the write failed before the rename
+            os.remove(tmp)
+
+    if hasattr(os, "O_DIRECTORY"):
+        # persist the rename itself (not supported on Windows)
+        dfd = os.open(os.path.dirname(path), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dfd)
+        finally:
+            os.close(dfd)
+
+
+async def write_data_file(path: os.PathLike, data, last_update: str) -> None:
+    """Write `data` to `path` as two length-prefixed MessagePack frames:
+    a `StalenessProbe` header stamped with `last_update`, followed by `data`.
+    """
+    await asyncio.to_thread(
+        write_payload,
+        path,
+        frame(ENCODER.encode(StalenessProbe(last_update))) + frame(ENCODER.encode(data)))
+    evict(str(path))
+
+
+def _decode_data_frame(path: str, decoder: msgspec.msgpack.Decoder) -> Any:
+    """Decode the data frame of the file at `path` from a memory map of the file."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 8 + int.from_bytes(mm[:4], 'big')
+        size = int.from_bytes(mm[start - 4:start], 'big')
+        with memoryview(mm)[start:start + size] as data:
+            return decoder.decode(data)
+
+
+DATA_CACHE: OrderedDict[tuple[str, float], Any] = OrderedDict()
+"""Decoded data frames keyed by (path, mtime), least recently used first"""
+DATA_CACHE_SIZE = 1024
+DATA_CACHE_LOCK = threading.Lock()
+
+LAST_UPDATE_CACHE: OrderedDict[tuple[str, float], datetime] = OrderedDict()
+"""`last_update` of data files keyed by (path, mtime), oldest first"""
+LAST_UPDATE_CACHE_SIZE = 8192
+LAST_UPDATE_CACHE_LOCK = threading.Lock()
+
+
+def evict(path: str) -> None:
+    """Drop the cached data frame and `last_update` of the file at `path`."""
+    with DATA_CACHE_LOCK:
+        for key in [k for k in DATA_CACHE if k[0] == path]:
+            del DATA_CACHE[key]
+    with LAST_UPDATE_CACHE_LOCK:
+        for key in [k for k in LAST_UPDATE_CACHE if k[0] == path]:
+            del LAST_UPDATE_CACHE[key]
+
+
+async def read_data_frame(path: str, decoder: msgspec.msgpack.Decoder = DECODER) -> Any:
+    """Decode the data frame of the file at `path` with `decoder`.
+
+    The file modification time is part of the cache key, so that a
+    modified file is never served from the cache.
+    """
+    key = (path, os.stat(path).st_mtime)
+    with DATA_CACHE_LOCK:
+        if key in DATA_CACHE:
+            DATA_CACHE.move_to_end(key)
+            return DATA_CACHE[key]
+
+    data = await asyncio.to_thread(_decode_data_frame, path, decoder)
+
+    with DATA_CACHE_LOCK:
+        DATA_CACHE[key] = data
+        if len(DATA_CACHE) > DATA_CACHE_SIZE:
+            DATA_CACHE.popitem(last=False)
+    return data
+
+
+async def read_last_update(path: str) -> Optional[datetime]:
+    """Get the `last_update` of the file at `path`, `None` if it does not exist."""
+    try:
+        key = (path, os.stat(path).st_mtime)
+    except FileNotFoundError:
+        return None
+
+    with LAST_UPDATE_CACHE_LOCK:
+        lastupd = LAST_UPDATE_CACHE.get(key)
+    if lastupd is None:
+        async with aiofiles.open(path, "rb") as f:
+            # the header frame is a few dozen bytes, read it in one go
+            head = await f.read(_PROBE_READ_SIZE)
+            size = int.from_bytes(head[:4], 'big')
+            if len(head) < 4 + size:
+                head += await f.read(4 + size - len(head))
+        lastupd = datetime.fromisoformat(
+            _PROBE_DECODER.decode(head[4:4 + size]).last_update)
+        if lastupd.tzinfo is None:
+            # files written before timestamps carried a UTC offset
+            lastupd = lastupd.replace(tzinfo=timezone.utc)
+
+        with LAST_UPDATE_CACHE_LOCK:
+            LAST_UPDATE_CACHE[key] = lastupd
+            if len(LAST_UPDATE_CACHE) > LAST_UPDATE_CACHE_SIZE:
+                LAST_UPDATE_CACHE.popitem(last=False)
+    return lastupd
+
+
+class CsvCache:
+    """In-memory TTL cache of a CSV dataset with rows grouped by `key`"""
+
+    def __init__(self,
+                 fetch: Callable[[aiohttp.ClientSession], Awaitable[list]],
+                 key: Callable[[list[str]], Hashable] = itemgetter(0),
+                 ttl: float = 12 * 60 * 60) -> None:
+        self._fetch = fetch
+        self._key = key
+        self._ttl = ttl
+        self._groups: dict[Hashable, tuple[tuple[str, ...], ...]] = {}
+        self._fetched_at: Optional[float] = None
+        self._locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = \
+            weakref.WeakKeyDictionary()
+
+    def _is_expired(self) -> bool:
+        return self._fetched_at is None or time.monotonic() - self._fetched_at > self._ttl
+
+    async def groups(self, session: aiohttp.ClientSession
+                     ) -> dict[Hashable, tuple[tuple[str, ...], ...]]:
+        """Get the CSV rows (excluding the header and empty rows) grouped by `key`.
+
+        The dataset is tokenised once per download and the rows are kept as
+        immutable tuples, so they can be shared between concurrent callers.
+        The dataset is downloaded again once the cache expired.
+        """
+        if self._is_expired():
+            async with self._locks.setdefault(asyncio.get_running_loop(), asyncio.Lock()):
+                if self._is_expired():
+                    groups = defaultdict(list)
+                    rows = csv.reader(await self._fetch(session))
+                    next(rows)  # ignore header line
+                    for row in rows:
+                        if any(row):
+                            groups[self._key(row)].append(tuple(row))
+                    self._groups = {k: tuple(v) for k, v in groups.items()}
+                    self._fetched_at = time.monotonic()
+        return self._groups
+
+
+class ValueCache:
+    """In-memory TTL cache of a single API lookup.
+
+    Concurrent lookups within an event loop share one request.
+    """
+
+    def __init__(self,
+                 fetch: Callable[[aiohttp.ClientSession], Awaitable[Any]],
+                 ttl: float = 12 * 60 * 60) -> None:
+        self._fetch = fetch
+        self._ttl = ttl
+        self._value: Any = None
+        self._fetched_at: Optional[float] = None
+        self._locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = \
+            weakref.WeakKeyDictionary()
+
+    def _is_expired(self) -> bool:
+        return self._fetched_at is None or time.monotonic() - self._fetched_at > self._ttl
+
+    async def get(self, session: aiohttp.ClientSession) -> Any:
+        """Get the value, fetching it again once the cache expired."""
+        if self._is_expired():
+            async with self._locks.setdefault(asyncio.get_running_loop(), asyncio.Lock()):
+                if self._is_expired():
+                    self._value = await self._fetch(session)
+                    self._fetched_at = time.monotonic()
+        return self._value
+
+
+class CoalescingCache:
+    """In-memory TTL cache of an API lookup keyed by a single argument.
+
+    Concurrent lookups of the same key within an event loop share one request.
+    """
+
+    def __init__(self,
+                 fetch: Callable[[str, aiohttp.ClientSession], Awaitable[Any]],
+                 maxsize: int = 5000,
+                 ttl: float = 12 * 60 * 60) -> None:
+        self._fetch = fetch
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._results: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop,
+                                                 dict[str, asyncio.Future]] = \
+            weakref.WeakKeyDictionary()
+
+    async def get(self, key: str, session: aiohttp.ClientSession) -> Any:
+        with self._lock:
+            if key in self._results:
+                fetched_at, result = self._results[key]
+                if time.monotonic() - fetched_at <= self._ttl:
+                    self._results.move_to_end(key)
+                    return result
+                del self._results[key]
+
+        pending = self._pending.setdefault(asyncio.get_running_loop(), {})
+        if key not in pending:
+            pending[key] = asyncio.ensure_future(self._fetch(key, session))
+            pending[key].add_done_callback(
+                lambda task: self._settle(pending, key, task))
+        return await asyncio.shield(pending[key])
+
+    def _settle(self, pending: dict[str, asyncio.Future], key: str, task: asyncio.Future) -> None:
+        del pending[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        with self._lock:
+            self._results[key] = (time.monotonic(), task.result())
+            if len(self._results) > self._maxsize:
+                self._results.popitem(last=False)
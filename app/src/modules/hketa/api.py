@@ -2,10 +2,64 @@
 This module includes methods to retrive transport related data (e.g. ETA)\
       from data.gov.hk
 """
+import asyncio
 import logging
-from typing import Literal
+import weakref
+from typing import Any, Coroutine, Literal, TypeVar
 
 import aiohttp
+import orjson
+
+_T = TypeVar('_T')
+
+_SESSIONS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession] = \
+    weakref.WeakKeyDictionary()
+"""Shared client session of each event loop"""
+
+# ----------------------------------------
+#            Session Management
+# ----------------------------------------
+
+
+def get_session() -> aiohttp.ClientSession:
+    """Get the shared client session of the running event loop.
+
+    The session is created on first use with a pooled connector, so that
+    keep-alive connections to the API hosts are reused across requests.
+    """
+    loop = asyncio.get_running_loop()
+    session = _SESSIONS.get(loop)
+    if session is None or session.closed:
+        session = _SESSIONS[loop] = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=200,
+                                           limit_per_host=20,
+                                           ttl_dns_cache=300,
+                                           keepalive_timeout=75,
+                                           enable_cleanup_closed=True),
+            # bound each socket operation rather than the whole request, so that
+            # time spent waiting for a pooled connection (e.g. during the
+            # all-routes ETA gather of the predictor) does not time requests out
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=30))
+    return session
+
+
+async def close_session() -> None:
+    """Close the shared client session of the running event loop (if any)."""
+    session = _SESSIONS.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+
+def run(main: Coroutine[Any, Any, _T]) -> _T:
+    """Execute `main` in a new event loop (see `asyncio.run`) and close
+    the shared client session opened within it.
+    """
+    async def wrapper() -> _T:
+        try:
+            return await main
+        finally:
+            await close_session()
+    return asyncio.run(wrapper())
 
 # ----------------------------------------
 #               ETA APIs
@@ -36,10 +90,10 @@ async def kmb_eta(route: str,
 
     if session is None:
         async with aiohttp.request('GET', url, raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
     else:
         async with session.get(url, raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
 
 
 async def nlb_eta(route_id: str,
@@ -67,10 +121,10 @@ async def nlb_eta(route_id: str,
 
     if session is None:
         async with aiohttp.request('GET', url, params=params, raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
     else:
         async with session.get(url, params=params, raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
 
 
 async def mtr_bus_eta(route: str,
@@ -100,13 +154,13 @@ async def mtr_bus_eta(route: str,
                 url,
                 json={"language": lang, "routeName": route},
                 raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
     else:
         async with session.post(
                 url,
                 json={"language": lang, "routeName": route},
                 raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
 
 
 async def mtr_lrt_eta(stop: int, session: aiohttp.ClientSession = None) -> dict:
@@ -133,13 +187,13 @@ async def mtr_lrt_eta(stop: int, session: aiohttp.ClientSession = None) -> dict:
                 url,
                 params={"station_id": stop},
                 raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
     else:
         async with session.get(
                 url,
                 params={"station_id": stop},
                 raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
 
 
 async def mtr_train_eta(route: str,
@@ -171,13 +225,13 @@ async def mtr_train_eta(route: str,
                 url,
                 params={"line": route, "sta": stop, "lang": lang},
                 raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
     else:
         async with session.get(
                 url,
                 params={"line": route, "sta": stop, "lang": lang},
                 raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
 
 
 async def bravobus_eta(company: Literal["ctb", "nwfb"],
@@ -208,10 +262,10 @@ async def bravobus_eta(company: Literal["ctb", "nwfb"],
 
     if session is None:
         async with aiohttp.request('GET', url, raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
     else:
         async with session.get(url, raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
 
 
 # ----------------------------------------
@@ -341,10 +395,10 @@ async def kmb_route_list(session: aiohttp.ClientSession = None) -> dict:
 
     if session is None:
         async with aiohttp.request('GET', url, raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
     else:
         async with session.get(url, raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
 
 
 async def kmb_route_stop_list(route: str,
@@ -372,10 +426,10 @@ async def kmb_route_stop_list(route: str,
 
     if session is None:
         async with aiohttp.request('GET', url, raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
     else:
         async with session.get(url, raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
 
 
 async def kmb_stop_details(stop_id: str,
@@ -399,10 +453,35 @@ async def kmb_stop_details(stop_id: str,
 
     if session is None:
         async with aiohttp.request('GET', url, raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
+    else:
+        async with session.get(url, raise_for_status=True) as response:
+            return orjson.loads(await response.read())
+
+
+async def kmb_stop_list(session: aiohttp.ClientSession = None) -> dict:
+    """Fetch information of all KMB stops from `Stop List Data` API
+
+    KMB API(s): https://data.gov.hk/en-data/dataset/hk-td-tis_21-etakmb
+
+    Args:
+        session (aiohttp.ClientSession, optional): client session for HTTP connections
+
+    Returns:
+        dict: see https://data.etabus.gov.hk/datagovhk/kmb_eta_data_dictionary.pdf
+
+    Raises:
+        aiohttp.ClientError: An error occurred when making the HTTP request
+    """
+    url = "https://data.etabus.gov.hk/v1/transport/kmb/stop"
+    logging.debug("GET request to '%s'", url)
+
+    if session is None:
+        async with aiohttp.request('GET', url, raise_for_status=True) as response:
+            return orjson.loads(await response.read())
     else:
         async with session.get(url, raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
 
 
 async def bravobus_route_list(company: Literal["ctb", "nwfb"],
@@ -427,10 +506,10 @@ async def bravobus_route_list(company: Literal["ctb", "nwfb"],
 
     if session is None:
         async with aiohttp.request('GET', url, raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
     else:
         async with session.get(url, raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
 
 
 async def bravobus_route_stop_list(
@@ -460,10 +539,10 @@ async def bravobus_route_stop_list(
 
     if session is None:
         async with aiohttp.request('GET', url, raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
     else:
         async with session.get(url, raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
 
 
 async def bravobus_stop_details(stop_id: str,
@@ -487,10 +566,10 @@ async def bravobus_stop_details(stop_id: str,
 
     if session is None:
         async with aiohttp.request('GET', url, raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
     else:
         async with session.get(url, raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
 
 
 async def nlb_route_list(session: aiohttp.ClientSession = None) -> dict:
@@ -510,10 +589,10 @@ async def nlb_route_list(session: aiohttp.ClientSession = None) -> dict:
     url = "https://rt.data.gov.hk/v2/transport/nlb/route.php?action=list"
     if session is None:
         async with aiohttp.request('GET', url, raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
     else:
         async with session.get(url, raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
 
 
 async def nlb_route_stop_list(route_id: str,
@@ -534,7 +613,7 @@ async def nlb_route_stop_list(route_id: str,
     url = f"https://rt.data.gov.hk/v2/transport/nlb/stop.php?action=list&routeId={route_id}"
     if session is None:
         async with aiohttp.request('GET', url, raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
     else:
         async with session.get(url, raise_for_status=True) as response:
-            return await response.json()
+            return orjson.loads(await response.read())
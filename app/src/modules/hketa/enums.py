@@ -8,11 +8,7 @@ class Locale(str, Enum):
     EN = "en"
 
     def description(self) -> str:
-        match self:
-            case Locale.TC:
-                return "繁體中文"
-            case Locale.EN:
-                return "English"
+        return _LOCALE_DESCRIPTIONS.get(self)
 
 
 class Transport(str, Enum):
@@ -27,22 +23,9 @@ class Transport(str, Enum):
     NLB = "nlb"
 
     def description(self, language: Locale = Locale.TC) -> str:
-        if language == Locale.EN:
-            match self:
-                case Transport.KMB: return "KMB"
-                case Transport.MTRBUS: return "MTR (Bus)"
-                case Transport.MTRLRT: return "MTR (Light Rail)"
-                case Transport.MTRTRAIN: return "MTR"
-                case Transport.CTB: return "City Bus"
-                case Transport.NLB: return "New Lantao Bus"
-        else:
-            match self:
-                case Transport.KMB: return "九巴"
-                case Transport.MTRBUS: return "港鐵巴士"
-                case Transport.MTRLRT: return "輕鐵"
-                case Transport.MTRTRAIN: return "港鐵"
-                case Transport.CTB: return "城巴"
-                case Transport.NLB: return "新大嶼山巴士"
+        if language != Locale.EN:
+            language = Locale.TC
+        return _TRANSPORT_DESCRIPTIONS.get((language, self))
 
 
 class Direction(str, Enum):
@@ -52,15 +35,7 @@ class Direction(str, Enum):
     INBOUND = DOWNLINK = "inbound"
 
     def description(self, language: Locale = Locale.TC) -> str:
-        match language, self:
-            case Locale.TC, Direction.OUTBOUND:
-                return "去程"
-            case Locale.TC, Direction.INBOUND:
-                return "回程"
-            case Locale.EN, Direction.OUTBOUND:
-                return "Outbound"
-            case Locale.EN, Direction.INBOUND:
-                return "Inbound"
+        return _DIRECTION_DESCRIPTIONS.get((language, self))
 
 
 class StopType(str, Enum):
@@ -71,16 +46,42 @@ class StopType(str, Enum):
     DEST = DESTINATION = "dest"
 
     def description(self, language: Locale = Locale.TC) -> "StopType":
-        match language, self:
-            case Locale.TC, StopType.ORIG | StopType.ORIGINATION:
-                return "起點站"
-            case Locale.TC, StopType.STOP | StopType.MIDWAY:
-                return "中途站"
-            case Locale.TC, StopType.DEST | StopType.DESTINATION:
-                return "終點站"
-            case Locale.EN, StopType.ORIG | StopType.ORIGINATION:
-                return "Origination"
-            case Locale.EN, StopType.STOP | StopType.MIDWAY:
-                return "Midway Stop"
-            case Locale.EN, StopType.DEST | StopType.DESTINATION:
-                return "Destination"
+        return _STOP_TYPE_DESCRIPTIONS.get((language, self))
+
+
+# descriptions are looked up on every call, keep them as plain mappings
+_LOCALE_DESCRIPTIONS = {
+    Locale.TC: "繁體中文",
+    Locale.EN: "English",
+}
+
+_TRANSPORT_DESCRIPTIONS = {
+    (Locale.EN, Transport.KMB): "KMB",
+    (Locale.EN, Transport.MTRBUS): "MTR (Bus)",
+    (Locale.EN, Transport.MTRLRT): "MTR (Light Rail)",
+    (Locale.EN, Transport.MTRTRAIN): "MTR",
+    (Locale.EN, Transport.CTB): "City Bus",
+    (Locale.EN, Transport.NLB): "New Lantao Bus",
+    (Locale.TC, Transport.KMB): "九巴",
+    (Locale.TC, Transport.MTRBUS): "港鐵巴士",
+    (Locale.TC, Transport.MTRLRT): "輕鐵",
+    (Locale.TC, Transport.MTRTRAIN): "港鐵",
+    (Locale.TC, Transport.CTB): "城巴",
+    (Locale.TC, Transport.NLB): "新大嶼山巴士",
+}
+
+_DIRECTION_DESCRIPTIONS = {
+    (Locale.TC, Direction.OUTBOUND): "去程",
+    (Locale.TC, Direction.INBOUND): "回程",
+    (Locale.EN, Direction.OUTBOUND): "Outbound",
+    (Locale.EN, Direction.INBOUND): "Inbound",
+}
+
+_STOP_TYPE_DESCRIPTIONS = {
+    (Locale.TC, StopType.ORIG): "起點站",
+    (Locale.TC, StopType.STOP): "中途站",
+    (Locale.TC, StopType.DEST): "終點站",
+    (Locale.EN, StopType.ORIG): "Origination",
+    (Locale.EN, StopType.STOP): "Midway Stop",
+    (Locale.EN, StopType.DEST): "Destination",
+}
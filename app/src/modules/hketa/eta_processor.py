@@ -1,7 +1,8 @@
-import asyncio
 import os
+import re
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
 
 import pytz
@@ -23,6 +24,10 @@ _DATASET_PATH = Path(os.environ.get('APP_CACHE_PATH',
     .joinpath('datasets')
 
 
+_has_digit = re.compile(r"\d").search
+"""Search for the first digit of a string"""
+
+
 def _8601str(dt: datetime) -> str:
     """Convert a `datetime` instance to ISO-8601 formatted string."""
     return dt.isoformat(sep='T', timespec='seconds')
@@ -34,6 +39,8 @@ class EtaProcessor(ABC):
     Retrive, process and unify the format of ETA(s) data
     """
 
+    __slots__ = ('_route',)
+
     @property
     def route(self) -> Route:
         return self._route
@@ -48,7 +55,7 @@ class EtaProcessor(ABC):
         self._route = route
 
     @abstractmethod
-    def etas(self) -> list[dict[str, str | int]]:
+    async def etas(self) -> list[dict[str, str | int]]:
         """Return processed ETAs
 
         Returns:
@@ -72,9 +79,15 @@ class EtaProcessor(ABC):
 
 class KmbEta(EtaProcessor):
 
+    __slots__ = ('direction',)
+
     _locale_map = {enums.Locale.TC: "tc", enums.Locale.EN: "en"}
 
-    def etas(self):
+    def __init__(self, route: Route) -> None:
+        super().__init__(route)
+        self.direction = self.route.entry.direction[0].upper()
+
+    async def etas(self):
         # [API Responses Remark]
         #   Timestamps include tzinfo (GMT+8)
         #   Remark (ETA) at "rmk_{locale}"
@@ -84,50 +97,47 @@ class KmbEta(EtaProcessor):
             self.route.provider
         )
 
-        response = asyncio.run(self.raw_etas())
+        response = await self.raw_etas()
         timestamp = datetime.fromisoformat(response['generated_timestamp'])
         locale = self._locale_map[self.route.entry.lang]
+        rmk_key, dest_key = f'rmk_{locale}', f'dest_{locale}'
+        stop_seq = self.route.stop_seq()
         etas = []
 
-        for stop in response['data']:
-            if (stop["seq"] != self.route.stop_seq()
-                    or stop["dir"] != self.route.entry.direction[0].upper()):
-                continue
+        #  NOTE: the number of ETA entry form API at the same stop may not be 3 every time.
+        #  KMB only provide at most 3 upcoming ETAs
+        #  (e.g. N- routes may provide only 2)
+        for stop in islice((s for s in response['data']
+                            if s["seq"] == stop_seq and s["dir"] == self.direction), 3):
             if stop["eta"] is None:
-                if stop[f'rmk_{locale}'] in ("", "最後班次已過", "最后班次已过", "The final bus has departed from this stop"):
+                if stop[rmk_key] in ("", "最後班次已過", "最后班次已过", "The final bus has departed from this stop"):
                     raise exceptions.EndOfService
-                raise exceptions.ErrorReturns(stop[f'rmk_{locale}'])
+                raise exceptions.ErrorReturns(stop[rmk_key])
 
             eta_dt = datetime.fromisoformat(stop["eta"])
+            eta_sec = (eta_dt - timestamp).total_seconds()
             etas.append(models.Eta(
-                destination=stop[f'dest_{locale}'],
-                is_arriving=(eta_dt - timestamp).total_seconds() < 30,
+                destination=stop[dest_key],
+                is_arriving=eta_sec < 30,
                 is_scheduled=stop.get('rmk_') in ('原定班次', 'Scheduled Bus'),
                 eta=_8601str(eta_dt),
-                eta_minute=int((eta_dt - timestamp).total_seconds() / 60),
-                remark=stop[f'rmk_{locale}'],
+                eta_minute=int(eta_sec / 60),
+                remark=stop[rmk_key],
                 extras=models.Eta.Extras(accuracy=predictor_.predict(self.route.entry.no,
                                                                      self.route.entry.direction,
-                                                                     self.route.stop_seq(),
+                                                                     stop_seq,
                                                                      datetime.fromisoformat(
                                                                          stop['data_timestamp']),
-                                                                     datetime.fromisoformat(
-                                                                         stop['eta']),
+                                                                     eta_dt,
                                                                      stop['rmk_en'],
                                                                      ))
             ))
 
-            if len(etas) == 3:
-                #  NOTE: the number of ETA entry form API at the same stop may not be 3 every time.
-                #  KMB only provide at most 3 upcoming ETAs
-                #  (e.g. N- routes may provide only 2)
-                break
-
         return etas
 
     async def raw_etas(self) -> dict[str | int]:
         response = await api.kmb_eta(
-            self.route.entry.no, self.route.entry.service_type)
+            self.route.entry.no, self.route.entry.service_type, api.get_session())
 
         if len(response) == 0:
             raise exceptions.APIError
@@ -139,9 +149,11 @@ class KmbEta(EtaProcessor):
 
 class MtrBusEta(EtaProcessor):
 
+    __slots__ = ()
+
     _locale_map = {enums.Locale.TC: "zh", enums.Locale.EN: "en"}
 
-    def etas(self):
+    async def etas(self):
         # [API Responses Remark]
         #   Timestamps do not include tzinfo (GMT+8)
         #   Remark (route) at "routeStatusRemarkTitle" & "routeStatusRemarkContent"
@@ -152,29 +164,33 @@ class MtrBusEta(EtaProcessor):
             self.route.provider
         )
 
-        response = asyncio.run(self.raw_etas())
-        timestamp = datetime.strptime(response["routeStatusTime"], "%Y/%m/%d %H:%M") \
-            .replace(tzinfo=pytz.timezone('Etc/GMT-8'))
+        response = await self.raw_etas()
+        # e.g. "2024/01/31 09:05"
+        date, _, time = response["routeStatusTime"].partition(" ")
+        timestamp = datetime(*map(int, date.split("/")), *map(int, time.split(":")),
+                             tzinfo=pytz.timezone('Etc/GMT-8'))
         etas = []
 
         for stop in response["busStop"]:
             if stop["busStopId"] != self.route.entry.stop:
                 continue
 
-            for eta in stop["bus"]:
-                time_ref = "departure" \
-                    if self.route.stop_type() == enums.StopType.ORIG \
-                    else "arrival"
+            time_ref = "departure" \
+                if self.route.stop_type() == enums.StopType.ORIG \
+                else "arrival"
+            text_key, sec_key = f'{time_ref}TimeText', f'{time_ref}TimeInSecond'
+            destination = self.route.destination().name.get(self.route.entry.lang)
 
-                if (any(char.isdigit() for char in eta[f'{time_ref}TimeText'])):
+            for eta in stop["bus"]:
+                if _has_digit(eta[text_key]):
                     # eta TimeText has numbers (e.g. 3 分鐘/3 Minutes)
-                    eta_sec = int(eta[f'{time_ref}TimeInSecond'])
+                    eta_sec = int(eta[sec_key])
                     etas.append(models.Eta(
-                        destination=self.route.destination().name.get(self.route.entry.lang),
+                        destination=destination,
                         is_arriving=False,
                         is_scheduled=eta['busLocation']['longitude'] == 0,
                         eta=_8601str(timestamp + timedelta(seconds=eta_sec)),
-                        eta_minute=eta[f'{time_ref}TimeText'].split(" ")[0],
+                        eta_minute=eta[text_key].split(" ")[0],
                         extras=models.Eta.Extras(accuracy=predictor_.predict(self.route.entry.no,
                                                                              self.route.entry.direction,
                                                                              self.route.entry.stop,
@@ -183,12 +199,12 @@ class MtrBusEta(EtaProcessor):
                     ))
                 else:
                     etas.append(models.Eta(
-                        destination=self.route.destination().name.get(self.route.entry.lang),
+                        destination=destination,
                         is_arriving=True,
                         is_scheduled=eta['busLocation']['longitude'] == 0,
                         eta=_8601str(datetime.now().astimezone(_GMT8_TZ)),
                         eta_minute=0,
-                        remark=eta[f'{time_ref}TimeText'],
+                        remark=eta[text_key],
                     ))
             break
 
@@ -203,7 +219,7 @@ class MtrBusEta(EtaProcessor):
         #  elif data["routeStatusRemarkTitle"] == "停止服務":
         #      raise EndOfServices
         response = await api.mtr_bus_eta(
-            self.route.name(), self._locale_map[self.route.entry.lang])
+            self.route.name(), self._locale_map[self.route.entry.lang], api.get_session())
 
         if len(response) == 0:
             raise exceptions.APIError
@@ -218,30 +234,33 @@ class MtrBusEta(EtaProcessor):
 
 class MtrLrtEta(EtaProcessor):
 
+    __slots__ = ()
+
     _locale_map = {enums.Locale.TC: "ch", enums.Locale.EN: "en"}
 
-    def etas(self):
+    async def etas(self):
         # [API Responses Remark]
         #   Timestamps do not include tzinfo (GMT+8)
         #   No remark fields
 
-        response = asyncio.run(self.raw_etas())
+        response = await self.raw_etas()
         timestamp = datetime.fromisoformat(response['system_time']) \
             .replace(tzinfo=pytz.timezone('Etc/GMT-8'))
         lang_code = self._locale_map[self.route.entry.lang]
+        dest_key, time_key = f'dest_{lang_code}', f'time_{lang_code}'
+        route_dest = self.route.destination().name.get(self.route.entry.lang)
         etas = []
 
         for platform in response['platform_list']:
             # the platform may ended service
             for eta in platform.get("route_list", []):
                 # 751P have no destination and eta
-                destination = eta.get(f'dest_{lang_code}')
-                if (eta['route_no'] != self.route.entry.no
-                        or destination != self.route.destination().name.get(self.route.entry.lang)):
+                destination = eta.get(dest_key)
+                if eta['route_no'] != self.route.entry.no or destination != route_dest:
                     continue
 
                 # e.g. 3 分鐘 / 即將抵達
-                eta_min = eta[f'time_{lang_code}'].split(" ")[0]
+                eta_min = eta[time_key].split(" ")[0]
                 if eta_min.isnumeric():
                     etas.append(models.Eta(
                         destination=destination,
@@ -272,7 +291,7 @@ class MtrLrtEta(EtaProcessor):
         return etas
 
     async def raw_etas(self) -> dict[str | int]:
-        response = await api.mtr_lrt_eta(self.route.entry.stop)
+        response = await api.mtr_lrt_eta(self.route.entry.stop, api.get_session())
 
         if len(response) == 0 or response.get('status', 0) == 0:
             raise exceptions.APIError
@@ -285,6 +304,8 @@ class MtrLrtEta(EtaProcessor):
 
 class MtrTrainEta(EtaProcessor):
 
+    __slots__ = ('linename', 'direction')
+
     _bound_map = {"inbound": "UP", "outbound": "DOWN"}
 
     def __init__(self, route: Route) -> None:
@@ -292,12 +313,12 @@ class MtrTrainEta(EtaProcessor):
         self.linename = self.route.entry.no.split("-")[0]
         self.direction = self._bound_map[self.route.entry.direction]
 
-    def etas(self) -> dict:
+    async def etas(self) -> dict:
         # [API Responses Remark]
         #   Timestamps do not include tzinfo (GMT+8)
         #   No remark fields
 
-        response = asyncio.run(self.raw_etas())
+        response = await self.raw_etas()
         timestamp = datetime.fromisoformat(response["curr_time"]) \
             .replace(tzinfo=pytz.timezone('Etc/GMT-8'))
         etas = []
@@ -307,14 +328,15 @@ class MtrTrainEta(EtaProcessor):
         for entry in etadata:
             eta_dt = datetime.fromisoformat(entry["time"]) \
                 .replace(tzinfo=pytz.timezone('Etc/GMT-8'))
+            eta_sec = (eta_dt - timestamp).total_seconds()
             etas.append(models.Eta(
                 destination=(self.route.stop_details(entry['dest'])
                              .name
                              .get(self.route.entry.lang)),
-                is_arriving=(eta_dt - timestamp).total_seconds() < 90,
+                is_arriving=eta_sec < 90,
                 is_scheduled=False,
                 eta=_8601str(eta_dt),
-                eta_minute=int((eta_dt - timestamp).total_seconds() / 60),
+                eta_minute=int(eta_sec / 60),
                 extras=models.Eta.Extras(platform=entry['plat'])
             ))
 
@@ -323,7 +345,8 @@ class MtrTrainEta(EtaProcessor):
     async def raw_etas(self) -> dict[str | int]:
         response = await api.mtr_train_eta(self.linename,
                                            self.route.entry.stop,
-                                           self.route.entry.lang)
+                                           self.route.entry.lang,
+                                           api.get_session())
         if len(response) == 0:
             raise exceptions.APIError
         if response.get('status', 0) == 0:
@@ -341,40 +364,48 @@ class MtrTrainEta(EtaProcessor):
 
 class BravoBusEta(EtaProcessor):
 
+    __slots__ = ('direction',)
+
     _locale_map = {enums.Locale.TC: "tc", enums.Locale.EN: "en"}
 
-    def etas(self) -> dict:
+    def __init__(self, route: Route) -> None:
+        super().__init__(route)
+        self.direction = self.route.entry.direction[0].upper()
+
+    async def etas(self) -> dict:
         # [API Responses Remark]
         #   Timestamps include tzinfo (GMT+8)
         #   Remark (ETA) at "rmk_{locale}"
 
-        response = asyncio.run(self.raw_etas())
+        response = await self.raw_etas()
         timestamp = datetime.fromisoformat(response['generated_timestamp'])
         lang_code = self._locale_map[self.route.entry.lang]
+        rmk_key, dest_key = f"rmk_{lang_code}", f"dest_{lang_code}"
         etas = []
 
         for eta in response['data']:
-            if eta['dir'] != self.route.entry.direction[0].upper():
+            if eta['dir'] != self.direction:
                 continue
             if eta['eta'] == "":
                 # 九巴時段
                 etas.append(models.Eta(
-                    destination=eta[f"dest_{lang_code}"],
+                    destination=eta[dest_key],
                     is_arriving=False,
                     is_scheduled=True,
                     eta=None,
                     eta_minute=None,
-                    remark=eta[f"rmk_{lang_code}"]
+                    remark=eta[rmk_key]
                 ))
             else:
                 eta_dt = datetime.fromisoformat(eta['eta'])
+                eta_sec = (eta_dt - timestamp).total_seconds()
                 etas.append(models.Eta(
-                    destination=eta[f"dest_{lang_code}"],
-                    is_arriving=(eta_dt - timestamp).total_seconds() < 60,
+                    destination=eta[dest_key],
+                    is_arriving=eta_sec < 60,
                     is_scheduled=False,
                     eta=_8601str(eta_dt),
-                    eta_minute=int((eta_dt - timestamp).total_seconds() / 60),
-                    remark=eta[f"rmk_{lang_code}"]
+                    eta_minute=int(eta_sec / 60),
+                    remark=eta[rmk_key]
                 ))
 
         return etas
@@ -382,7 +413,8 @@ class BravoBusEta(EtaProcessor):
     async def raw_etas(self) -> dict[str | int]:
         response = await api.bravobus_eta(self.route.entry.company.value,
                                           self.route.entry.stop,
-                                          self.route.entry.no)
+                                          self.route.entry.no,
+                                          api.get_session())
         if len(response) == 0 or response.get('data') is None:
             raise exceptions.APIError
         if len(response['data']) == 0:
@@ -392,6 +424,8 @@ class BravoBusEta(EtaProcessor):
 
 class NlbEta(EtaProcessor):
 
+    __slots__ = ('linename', 'direction')
+
     _bound_map = {"inbound": "UP", "outbound": "DOWN"}
     _lang_map = {enums.Locale.TC: 'zh', enums.Locale.EN: 'en', }
 
@@ -400,26 +434,27 @@ class NlbEta(EtaProcessor):
         self.linename = self.route.entry.no.split("-")[0]
         self.direction = self._bound_map[self.route.entry.direction]
 
-    def etas(self) -> dict:
+    async def etas(self) -> dict:
         # [API Responses Remark]
         #   Timestamps do not tzinfo (GMT+8)
 
-        response = asyncio.run(self.raw_etas())
+        response = await self.raw_etas()
         timestamp = datetime.now().replace(tzinfo=pytz.timezone('Etc/GMT-8'))
+        destination = self.route.destination().name.get(self.route.entry.lang)
         etas = []
 
         for eta in response['estimatedArrivals']:
             eta_dt = datetime.fromisoformat(eta['estimatedArrivalTime']) \
                 .replace(tzinfo=pytz.timezone('Etc/GMT-8'))
+            eta_sec = (eta_dt - timestamp).total_seconds()
 
             etas.append(models.Eta(
-                destination=(
-                    self.route.destination().name.get(self.route.entry.lang)),
-                is_arriving=(eta_dt - timestamp).total_seconds() < 60,
+                destination=destination,
+                is_arriving=eta_sec < 60,
                 is_scheduled=not (eta.get('departed') == '1'
                                   and eta.get('noGPS') == '1'),
                 eta=_8601str(eta_dt),
-                eta_minute=int((eta_dt - timestamp).total_seconds() / 60),
+                eta_minute=int(eta_sec / 60),
                 extras=models.Eta.Extras(
                     route_variant=eta.get('routeVariantName'),)
             ))
@@ -429,7 +464,8 @@ class NlbEta(EtaProcessor):
     async def raw_etas(self) -> dict[str | int]:
         response = await api.nlb_eta(self.route.id(),
                                      self.route.entry.stop,
-                                     self._lang_map[self.route.entry.lang])
+                                     self._lang_map[self.route.entry.lang],
+                                     api.get_session())
 
         if len(response) == 0:
             # incorrect parameter will result in a empty json response
@@ -5,7 +5,8 @@ class HketaException(Exception):
     """Base exception of HketaException"""
 
     def __init__(self, *args: object) -> None:
-        logging.error("Error occurs: %s", self.__class__.__name__)
+        # most are expected outcomes (e.g. end of service), not failures
+        logging.debug("Error occurs: %s", self.__class__.__name__)
         super().__init__(*args)
 
 
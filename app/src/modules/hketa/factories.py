@@ -21,6 +21,27 @@ class EtaFactory:
     threshold: int
     """Expiry threshold of the local routes data file"""
 
+    _transports = {
+        enums.Transport.KMB: transport.KowloonMotorBus,
+        enums.Transport.MTRBUS: transport.MTRBus,
+        enums.Transport.MTRLRT: transport.MTRLightRail,
+        enums.Transport.MTRTRAIN: transport.MTRTrain,
+        enums.Transport.CTB: transport.CityBus,
+        enums.Transport.NLB: transport.NewLantaoBus,
+    }
+    """Transport of each company"""
+
+    _eta_processors = {
+        enums.Transport.KMB: eta_processor.KmbEta,
+        enums.Transport.MTRBUS: eta_processor.MtrBusEta,
+        enums.Transport.MTRLRT: eta_processor.MtrLrtEta,
+        enums.Transport.MTRTRAIN: eta_processor.MtrTrainEta,
+        enums.Transport.CTB: eta_processor.BravoBusEta,
+        enums.Transport.NWFB: eta_processor.BravoBusEta,
+        enums.Transport.NLB: eta_processor.NlbEta,
+    }
+    """ETA processor of each company"""
+
     def __init__(self,
                  data_path: os.PathLike = None,
                  store: bool = False,
@@ -30,48 +51,14 @@ class EtaFactory:
         self.threshold = threshold
 
     def create_transport(self, company: enums.Transport) -> transport.Transport:
-        match company:
-            case enums.Transport.KMB:
-                return transport.KowloonMotorBus(self.data_path,
-                                                 self.store,
-                                                 self.threshold)
-            case enums.Transport.MTRBUS:
-                return transport.MTRBus(self.data_path,
-                                        self.store,
-                                        self.threshold)
-            case enums.Transport.MTRLRT:
-                return transport.MTRLightRail(self.data_path,
-                                              self.store,
-                                              self.threshold)
-            case enums.Transport.MTRTRAIN:
-                return transport.MTRTrain(self.data_path,
-                                          self.store,
-                                          self.threshold)
-            case enums.Transport.CTB:
-                return transport.CityBus(self.data_path,
-                                         self.store,
-                                         self.threshold)
-            case enums.Transport.NLB:
-                return transport.NewLantaoBus(self.data_path,
-                                              self.store,
-                                              self.threshold)
-            case _:
-                raise ValueError(f"Unrecognized company: {company}")
+        transport_ = self._transports.get(company)
+        if transport_ is None:
+            raise ValueError(f"Unrecognized company: {company}")
+        return transport_(self.data_path, self.store, self.threshold)
 
-    def create_eta_processor(self, entry: models.RouteEntry) -> eta_processor.EtaProcessor:
-        route = Route(entry, self.create_transport(entry.company))
-        match entry.company:
-            case enums.Transport.KMB:
-                return eta_processor.KmbEta(route)
-            case enums.Transport.MTRBUS:
-                return eta_processor.MtrBusEta(route)
-            case enums.Transport.MTRLRT:
-                return eta_processor.MtrLrtEta(route)
-            case enums.Transport.MTRTRAIN:
-                return eta_processor.MtrTrainEta(route)
-            case enums.Transport.CTB | enums.Transport.NWFB:
-                return eta_processor.BravoBusEta(route)
-            case enums.Transport.NLB:
-                return eta_processor.NlbEta(route)
-            case _:
-                raise ValueError(f"Unrecognized company: {entry.company}")
+    async def create_eta_processor(self, entry: models.RouteEntry) -> eta_processor.EtaProcessor:
+        route = await Route.create(entry, self.create_transport(entry.company))
+        processor = self._eta_processors.get(entry.company)
+        if processor is None:
+            raise ValueError(f"Unrecognized company: {entry.company}")
+        return processor(route)
@@ -1,6 +1,8 @@
 # pylint: disable=unnecessary-lambda
 
-from typing import Optional
+from typing import Iterable, Optional
+
+import msgspec
 from pydantic import Field
 
 from pydantic.dataclasses import dataclass
@@ -24,7 +26,8 @@ class RouteEntry:
     lang: enums.Locale
 
     def __post_init__(self):
-        self.no = str(self.no).upper()
+        # `no` is already validated as `str`
+        self.no = self.no.upper()
 
 
 @dataclass(slots=True)
@@ -83,3 +86,65 @@ class Eta:
         car_length: Optional[int] = None
         route_variant: Optional[str] = None
         accuracy: Optional[int] = None
+
+
+class LocalizedName(msgspec.Struct):
+    """Name of a stop in each `enums.Locale`"""
+
+    tc: str
+    en: str
+
+    def as_dict(self) -> dict[enums.Locale, str]:
+        return {enums.Locale.TC: self.tc, enums.Locale.EN: self.en}
+
+
+class StopPoint(msgspec.Struct):
+    """Stop data stored in the local cache"""
+
+    stop_code: str
+    seq: int
+    name: LocalizedName
+
+
+class StopArray(msgspec.Struct):
+    """Stop list stored in the local cache, one array per field"""
+
+    stop_codes: list[str]
+    seqs: list[int]
+    names_tc: list[str]
+    names_en: list[str]
+
+    @classmethod
+    def from_stops(cls, stops: Iterable[StopPoint]) -> "StopArray":
+        array = cls([], [], [], [])
+        for stop in stops:
+            array.stop_codes.append(stop.stop_code)
+            array.seqs.append(stop.seq)
+            array.names_tc.append(stop.name.tc)
+            array.names_en.append(stop.name.en)
+        return array
+
+    def __len__(self) -> int:
+        return len(self.stop_codes)
+
+    def view(self, idx: int) -> StopPoint:
+        """Get the `idx`-th stop of the list"""
+        return StopPoint(stop_code=self.stop_codes[idx],
+                         seq=self.seqs[idx],
+                         name=LocalizedName(tc=self.names_tc[idx], en=self.names_en[idx]))
+
+
+class RouteEndpoints(msgspec.Struct):
+    """Terminal stops of a service type stored in the local cache"""
+
+    service_type: str
+    orig: StopPoint
+    dest: Optional[StopPoint] = None
+    route_id: Optional[str] = None
+
+
+class RouteDirection(msgspec.Struct):
+    """Service types of a route in each direction stored in the local cache"""
+
+    inbound: list[RouteEndpoints] = []
+    outbound: list[RouteEndpoints] = []
@@ -205,10 +205,7 @@ class Predictor(ABC):
             .joinpath(self.__path_prefix__ or self.__class__.__name__.lower())
         self.raws_dir = self.root_dir.joinpath('raws')
 
-        if not self.root_dir.exists():
-            os.makedirs(self.root_dir)
-        if not self.raws_dir.exists():
-            os.makedirs(self.raws_dir)
+        os.makedirs(self.raws_dir, exist_ok=True)
 
 
 class KmbPredictor(Predictor):
@@ -264,9 +261,9 @@ class KmbPredictor(Predictor):
             except (aiohttp.ClientError, asyncio.TimeoutError):
                 return r, []
 
-        async with aiohttp.ClientSession() as s:
-            responses = await asyncio.gather(
-                *[eta_with_route(r, s) for r in self.transport_.routes.keys()])
+        session = api.get_session()
+        routes = await self.transport_.load_routes()
+        responses = await asyncio.gather(*[eta_with_route(r, session) for r in routes.keys()])
 
         # NOTE: using context manager with multiprocessing.Pool and uvicorn will cause uvicorn to restart
         with Pool(context=SpawnContext()) as pool:
@@ -348,10 +345,10 @@ class MtrBusPredictor(Predictor):
         processed_etas = {}
         # timestamp from the API is not accurate enough
         data_timestamp = datetime.now(tz=pytz.timezone('Etc/GMT-8'))
-        async with aiohttp.ClientSession() as s:
-            responses = await asyncio.gather(*[api.mtr_bus_eta(r, 'en', s)
-                                             for r in self.transport_.route_list().keys()],
-                                             return_exceptions=True)
+        session = api.get_session()
+        responses = await asyncio.gather(*[api.mtr_bus_eta(r, 'en', session)
+                                         for r in (await self.transport_.route_list()).keys()],
+                                         return_exceptions=True)
 
         for route in responses:
             if isinstance(route, aiohttp.ClientError):
@@ -1,3 +1,5 @@
+from typing import Iterable
+
 try:
     from . import enums, exceptions, models, transport
 except (ImportError, ModuleNotFoundError):
@@ -38,17 +40,24 @@ class Route:
     provider: transport.Transport
     _stop_list: dict[str, models.RouteInfo.Stop]
 
-    def __init__(self, entry: models.RouteEntry, transport_: transport.Transport) -> None:
+    def __init__(self,
+                 entry: models.RouteEntry,
+                 transport_: transport.Transport,
+                 stops: Iterable[models.RouteInfo.Stop]) -> None:
         self.entry = entry
         self.provider = transport_
-        self._stop_list = {
-            stop.stop_code: stop
-            for stop in self.provider.stop_list(entry.no, entry.direction, entry.service_type)
-        }
+        self._stop_list = {stop.stop_code: stop for stop in stops}
 
         if (self.entry.stop not in self._stop_list.keys()):
             raise exceptions.StopNotExist(self.entry.stop)
 
+    @classmethod
+    async def create(cls, entry: models.RouteEntry, transport_: transport.Transport) -> "Route":
+        """Create a `Route` with the stop list of `entry` retrived from `transport_`"""
+        return cls(entry,
+                   transport_,
+                   await transport_.stop_list(entry.no, entry.direction, entry.service_type))
+
     def comanpy(self) -> str:
         """Get the operating company name of the route"""
         return self.entry.company.description(self.entry.lang)
@@ -76,10 +85,10 @@ class Route:
         return self._stop_list[stop_code]
 
     def origin(self) -> models.RouteInfo.Stop:
-        return list(self._stop_list.values())[0]
+        return next(iter(self._stop_list.values()))
 
     def destination(self) -> models.RouteInfo.Stop:
-        stop = list(self._stop_list.values())[-1]
+        stop = next(reversed(self._stop_list.values()))
 
         # NOTE: in/outbound of circular routes are NOT its destination
         # NOTE: 705, 706 return "天水圍循環綫"/'TSW Circular' instead of its destination
@@ -1,51 +1,68 @@
 import asyncio
-import csv
 import io
-import json
 import logging
 import os
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from dataclasses import asdict, is_dataclass
-from datetime import datetime
-from functools import cmp_to_key
+from collections import defaultdict
+from datetime import datetime, timezone
+from functools import cached_property, cmp_to_key, lru_cache
 from pathlib import Path
-from typing import Any, Generator, Optional
+from operator import itemgetter
+from typing import Any, Awaitable, Callable, Generator, Hashable, Optional, TypeVar
 
 import aiohttp
+import msgspec
 
 try:
-    from . import api, enums, exceptions, models
+    from . import _cache, api, enums, exceptions, models
 except ImportError:
+    import _cache
     import api
     import enums
     import exceptions
     import models
 
+_T = TypeVar('_T')
+
 _DIRLOGO = os.path.join(os.path.dirname(__file__), "logo", "mono_neg")
-_TODAY = datetime.utcnow().isoformat(timespec="seconds")
-"""Today's date (ISO-8601 datetime)"""
 
 
-def singleton(cls):
-    instances = {}
+def _now_iso() -> str:
+    """Get the current UTC time as ISO-8601 datetime"""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
-    def wrapper(*args, **kwargs):
-        if cls not in instances:
-            instances[cls] = cls(*args, **kwargs)
-        return instances[cls]
-    return wrapper
 
+_ROUTES_DECODER = msgspec.msgpack.Decoder(dict[str, models.RouteDirection])
+_STOPS_DECODER = msgspec.msgpack.Decoder(models.StopArray)
 
-class _DataclassJSONEncoder(json.JSONEncoder):
-    """Encoder with dataclass support
 
-    Reference: https://stackoverflow.com/a/51286749
-    """
+_MTR_BUS_STOPS = _cache.CsvCache(api.mtr_bus_stop_list, itemgetter(0, 1))
+"""MTR bus stops grouped by (route, direction)"""
+_MTR_LRT_STOPS = _cache.CsvCache(api.mtr_lrt_route_stop_list, itemgetter(0, 1))
+"""MTR light rail stops grouped by (route, direction)"""
+_MTR_TRAIN_STOPS = _cache.CsvCache(api.mtr_train_route_stop_list, itemgetter(0, 1))
+"""MTR train stops grouped by (line, direction)"""
+
+
+_KMB_STOP_DETAILS = _cache.CoalescingCache(api.kmb_stop_details)
+_CTB_STOP_DETAILS = _cache.CoalescingCache(api.bravobus_stop_details)
+
+
+def singleton(cls):
+    instances = {}
+    lock = threading.Lock()
 
-    def default(self, o):
-        if is_dataclass(o):
-            return asdict(o)
-        return super().default(o)
+    def wrapper(*args, **kwargs):
+        instance = instances.get(cls)
+        if instance is None:
+            with lock:
+                instance = instances.get(cls)
+                if instance is None:
+                    instance = instances[cls] = cls(*args, **kwargs)
+        return instance
+    return wrapper
 
 
 class Transport(ABC):
@@ -72,30 +89,52 @@ class Transport(ABC):
     def company(self) -> enums.Transport:
         pass
 
-    @property
+    @cached_property
     def route_list_path(self) -> Path:
-        """Path to \"routes\" data file name"""
-        return self._root.joinpath('routes.json')
+        """Path to \"routes\" manifest file name"""
+        return self._root.joinpath('routes_manifest.mpk')
 
-    @property
+    @cached_property
     def stops_list_dir(self) -> Path:
         """Path to \"route\" data directory"""
         return self._root.joinpath('routes')
 
+    @cached_property
+    def route_shards_dir(self) -> Path:
+        """Path to \"routes\" data shards directory"""
+        return self.stops_list_dir.joinpath('_index')
+
+    @staticmethod
+    def _shard_key(route_no: str) -> str:
+        """Get the key of the \"routes\" data shard containing `route_no`"""
+        key = route_no[:1].upper()
+        return key if key.isalnum() else "_"
+
     @classmethod
-    def _put_data_file(cls, path: os.PathLike, data) -> None:
+    async def _put_data_file(cls,
+                             path: os.PathLike,
+                             data,
+                             last_update: Optional[str] = None) -> None:
         """Write `data` to local file system.
+
+        The file consists of two length-prefixed MessagePack frames:
+        a `_cache.StalenessProbe` header, stamped with `last_update` (the
+        current time if omitted), followed by `data`.
         """
         path = Path(str(path))
-        if not path.parent.exists():
-            os.makedirs(path.parent)
+        os.makedirs(path.parent, exist_ok=True)
+
+        logging.info("Saving %s data to %s", type(cls).__name__, path)
+        await _cache.write_data_file(path, data, last_update or _now_iso())
 
-        with open(path, "w", encoding="utf-8") as f:
-            logging.info("Saving %s data to %s", type(cls).__name__, path)
-            json.dump({'last_update': _TODAY, 'data': data},
-                      f,
-                      indent=4,
-                      cls=_DataclassJSONEncoder)
+    @staticmethod
+    async def _load_data_file(path: os.PathLike,
+                              decoder: msgspec.msgpack.Decoder = _cache.DECODER) -> Any:
+        """Read the data frame of a file written by `_put_data_file`.
+
+        Decoded data is kept in memory until the file is modified.
+        """
+        return await _cache.read_data_frame(str(path), decoder)
 
     def __init__(self,
                  root: os.PathLike[str] = None,
@@ -112,55 +151,72 @@ class Transport(ABC):
         self.is_store = store_local
         self.threshold = threshold
 
-        if store_local and not self._root.exists():
-            logging.info("'%s' does not exists, creating...", root)
-            os.makedirs(self.stops_list_dir)
+        if store_local:
+            # may race with other transports sharing `root`
+            os.makedirs(self.stops_list_dir, exist_ok=True)
 
-        self.routes = self.route_list()
+        self.routes: Optional[dict[str, models.RouteInfo]] = None
+        self._inflight: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop,
+                                                  dict[Hashable, asyncio.Future]] = \
+            weakref.WeakKeyDictionary()
+
+    async def load_routes(self) -> dict[str, models.RouteInfo]:
+        """Load the route list to `routes` if it is not loaded yet."""
+        if self.routes is None:
+            self.routes = await self._single_flight("routes", self.route_list)
+        return self.routes
+
+    async def _single_flight(self, key: Hashable, fetch: Callable[[], Awaitable[_T]]) -> _T:
+        """Await `fetch()`, sharing the call with concurrent callers of the same `key`
+        within the running event loop.
+        """
+        pending = self._inflight.setdefault(asyncio.get_running_loop(), {})
+        if key not in pending:
+            def settle(task: asyncio.Future) -> None:
+                del pending[key]
+                if not task.cancelled():
+                    task.exception()  # retrieved by the waiting callers
+
+            pending[key] = asyncio.ensure_future(fetch())
+            pending[key].add_done_callback(settle)
+        return await asyncio.shield(pending[key])
 
     @abstractmethod
     def logo(self) -> io.BufferedReader:
         """Get the company logo in bytes"""
 
     @abstractmethod
-    async def fetch_route_list(self) -> dict[str, dict[str, list]]:
+    async def fetch_route_list(self,
+                               session: Optional[aiohttp.ClientSession] = None
+                               ) -> dict[str, models.RouteDirection]:
         """Fetch the route list and route details from API
 
+        Args:
+            session (aiohttp.ClientSession, optional): client session for HTTP connections,
+                the shared session from `api.get_session` is used if omitted
+
         Returns:
-            >>> example
-            {
-                '<route name>': {
-                    'inbound': [{
-                        'service_type': str,
-                        'seq': int,
-                        'name': {
-                            '<locale>': str
-                        }    
-                    }],
-                    'outbound': list
-                }
-            }
+            dict[str, models.RouteDirection]: route details keyed by route name
         """
 
     @abstractmethod
     async def fetch_stop_list(self,
                               route_no: str,
                               direction: enums.Direction,
-                              service_type: str) -> list[dict[str, Any]]:
+                              service_type: str,
+                              session: Optional[aiohttp.ClientSession] = None
+                              ) -> list[models.StopPoint]:
         """Fetch the stop list of a the `entry` and stop details from API
 
+        Args:
+            session (aiohttp.ClientSession, optional): client session for HTTP connections,
+                the shared session from `api.get_session` is used if omitted
+
         Returns:
-            >>> example
-                [{
-                    'stop_code': str
-                    'seq': int,
-                    'name': {
-                        '<locale>': str
-                    }
-                }]
+            list[models.StopPoint]: stops of the route in order
         """
 
-    def route_list(self) -> dict[str, models.RouteInfo]:
+    async def route_list(self) -> dict[str, models.RouteInfo]:
         """Retrive all route list and data operating by the operator.
 
         Create/update local cache when necessary.
@@ -168,92 +224,121 @@ class Transport(ABC):
         if not self.is_store:
             logging.info("retiving %s routes data (no store is set)",
                          type(self).__name__)
-            routes = asyncio.run(self.fetch_route_list())
-        elif self._is_outdated(self.route_list_path):
+            routes = await self.fetch_route_list()
+        elif await self._is_outdated(self.route_list_path):
             logging.info("%s route list cache is outdated or not exists, updating...",
                          type(self).__name__)
 
-            routes = asyncio.run(self.fetch_route_list())
-            self._put_data_file(self.route_list_path, routes)
+            routes = await self.fetch_route_list()
+            await self._put_route_list(routes)
         else:
-            with open(self.route_list_path, "r", encoding="utf-8") as f:
-                logging.debug("Loading route list stop list from %s",
-                              self.route_list_path)
-                routes = json.load(f)['data']
-
-        return {
-            route: models.RouteInfo(
-                company=self.company,
-                route_no=route,
-                inbound=[
-                    models.RouteInfo.Detail(
-                        route_id=rt_type.get('route_id'),
-                        service_type=rt_type['service_type'],
-                        orig=models.RouteInfo.Stop(
-                            stop_code=rt_type['orig']['stop_code'],
-                            seq=rt_type['orig']['seq'],
-                            name={
-                                enums.Locale[locale.upper()]: text for locale, text in rt_type['orig']['name'].items()}
-                        ),
-                        dest=models.RouteInfo.Stop(
-                            stop_code=rt_type['dest']['stop_code'],
-                            seq=rt_type['dest']['seq'],
-                            name={
-                                enums.Locale[locale.upper()]: text for locale, text in rt_type['dest']['name'].items()}
-                        ) if rt_type['dest'] else None
-                    ) for rt_type in direction['inbound']
-                ],
-                outbound=[
-                    models.RouteInfo.Detail(
-                        route_id=rt_type.get('route_id'),
-                        service_type=rt_type['service_type'],
-                        orig=models.RouteInfo.Stop(
-                            stop_code=rt_type['orig']['stop_code'],
-                            seq=rt_type['orig']['seq'],
-                            name={
-                                enums.Locale[locale.upper()]: text for locale, text in rt_type['orig']['name'].items()}
-                        ),
-                        dest=models.RouteInfo.Stop(
-                            stop_code=rt_type['dest']['stop_code'],
-                            seq=rt_type['dest']['seq'],
-                            name={
-                                enums.Locale[locale.upper()]: text for locale, text in rt_type['dest']['name'].items()}
-                        )
-                    ) for rt_type in direction['outbound']
-                ]
-            ) for route, direction in routes.items()
-        }
-
-    def stop_list(self,
-                  route_no: str,
-                  direction: enums.Direction,
-                  service_type: str) -> Generator[models.RouteInfo.Stop, None, None]:
+            logging.debug("Loading route list stop list from %s",
+                          self.route_list_path)
+            routes = {}
+            for key in await self._load_data_file(self.route_list_path):
+                routes.update(await self._load_data_file(
+                    self.route_shards_dir.joinpath(f"{key}.mpk"), _ROUTES_DECODER))
+
+        return {route: self._route_info(route, direction)
+                for route, direction in routes.items()}
+
+    async def route_meta(self, route_no: str) -> models.RouteInfo:
+        """Retrive the data of a single route.
+
+        Only the \"routes\" data shard containing the route is loaded
+        if the local cache is up to date.
+        """
+        if not self.is_store or await self._is_outdated(self.route_list_path):
+            routes = await self.route_list()
+            if route_no not in routes:
+                raise exceptions.RouteNotExist(route_no)
+            return routes[route_no]
+
+        key = self._shard_key(route_no)
+        if key not in await self._load_data_file(self.route_list_path):
+            raise exceptions.RouteNotExist(route_no)
+        shard = await self._load_data_file(
+            self.route_shards_dir.joinpath(f"{key}.mpk"), _ROUTES_DECODER)
+        if route_no not in shard:
+            raise exceptions.RouteNotExist(route_no)
+        return self._route_info(route_no, shard[route_no])
+
+    async def _put_route_list(self, routes: dict[str, models.RouteDirection]) -> None:
+        """Write `routes` to local file system as shards grouped by `_shard_key`.
+
+        The manifest, listing the routes of each shard, is written last so
+        that an interrupted write leaves the cache outdated.
+        """
+        shards = defaultdict(dict)
+        for route_no, direction in routes.items():
+            shards[self._shard_key(route_no)][route_no] = direction
+
+        now = _now_iso()
+        for key, shard in shards.items():
+            await self._put_data_file(self.route_shards_dir.joinpath(f"{key}.mpk"), shard, now)
+        await self._put_data_file(self.route_list_path,
+                                  {key: list(shard.keys()) for key, shard in shards.items()},
+                                  now)
+
+    def _route_info(self, route: str, direction: models.RouteDirection) -> models.RouteInfo:
+        """Build a `models.RouteInfo` from the route data of `fetch_route_list`"""
+        def stop(point: models.StopPoint) -> models.RouteInfo.Stop:
+            return models.RouteInfo.Stop(
+                stop_code=point.stop_code,
+                seq=point.seq,
+                name=point.name.as_dict()
+            )
+
+        def details(endpoints: list[models.RouteEndpoints]) -> list[models.RouteInfo.Detail]:
+            return [
+                models.RouteInfo.Detail(
+                    route_id=rt_type.route_id,
+                    service_type=rt_type.service_type,
+                    orig=stop(rt_type.orig),
+                    dest=stop(rt_type.dest) if rt_type.dest else None
+                ) for rt_type in endpoints
+            ]
+
+        return models.RouteInfo(
+            company=self.company,
+            route_no=route,
+            inbound=details(direction.inbound),
+            outbound=details(direction.outbound)
+        )
+
+    async def stop_list(self,
+                        route_no: str,
+                        direction: enums.Direction,
+                        service_type: str) -> Generator[models.RouteInfo.Stop, None, None]:
         """Retrive stop list and data of the `route`.
 
         Create/update local cache when necessary.
         """
-        if route_no not in self.routes.keys():
+        if route_no not in (await self.load_routes()).keys():
             raise exceptions.RouteNotExist(route_no)
 
-        fpath = os.path.join(self.stops_list_dir,
-                             self.route_fname(route_no, direction, service_type))
+        fpath = self._stop_list_path(route_no, direction, service_type)
 
-        if not self.is_store:
-            # logging.info("Retiving %s route data (no store is set)", route_id)
-            stops = asyncio.run(
-                self.fetch_stop_list(route_no, direction, service_type))
-        elif self._is_outdated(fpath):
+        async def refresh() -> models.StopArray:
+            stops = models.StopArray.from_stops(
+                await self.fetch_stop_list(route_no, direction, service_type))
+            if self.is_store:
+                await self._put_data_file(fpath, stops)
+            return stops
+
+        if not self.is_store or await self._is_outdated(fpath):
             # logging.info(
             #     "%s stop list cache is outdated, updating...", route_id)
-            stops = asyncio.run(
-                self.fetch_stop_list(route_no, direction, service_type))
-            self._put_data_file(
-                self.stops_list_dir.joinpath(self.route_fname(route_no, direction, service_type)), stops)
+            # concurrent requests of the same route share one fetch
+            stops = await self._single_flight(fpath, refresh)
         else:
-            with open(fpath, "r", encoding="utf-8") as f:
-                # logging.debug("Loading %s stop list from %s", route_id, fpath)
-                stops = json.load(f)['data']
-        return (models.RouteInfo.Stop(**stop) for stop in stops)
+            # logging.debug("Loading %s stop list from %s", route_id, fpath)
+            stops = await self._load_data_file(fpath, _STOPS_DECODER)
+        return (models.RouteInfo.Stop(stop_code=code,
+                                      seq=seq,
+                                      name={enums.Locale.TC: tc, enums.Locale.EN: en})
+                for code, seq, tc, en in zip(stops.stop_codes, stops.seqs,
+                                             stops.names_tc, stops.names_en))
 
     def route_fname(self,
                     no: str,
@@ -266,11 +351,19 @@ class Transport(ABC):
 
         Returns:
             str: Name of the route data file 
-                (e.g. "1A-outbound-1.json", "TML-outbound.json")
+                (e.g. "1A-outbound-1.mpk", "TML-outbound-default.mpk")
         """
-        return f"{no.upper()}-{direction.value.lower()}-{service_type.lower()}.json"
+        return f"{no.upper()}-{direction.value.lower()}-{service_type.lower()}.mpk"
+
+    @lru_cache(maxsize=4096)
+    def _stop_list_path(self,
+                        no: str,
+                        direction: enums.Direction,
+                        service_type: str) -> Path:
+        """Get path to the stop data file of the route"""
+        return self.stops_list_dir.joinpath(self.route_fname(no, direction, service_type))
 
-    def _is_outdated(self, fpath: os.PathLike) -> bool:
+    async def _is_outdated(self, fpath: os.PathLike) -> bool:
         """Determine whether a data file is outdated.
 
         Args:
@@ -279,19 +372,19 @@ class Transport(ABC):
         Returns:
             bool: `true` if file not exists or outdated
         """
-        fpath = Path(str(fpath))
-        if fpath.exists():
-            with open(fpath, "r", encoding="utf-8") as f:
-                lastupd = datetime.fromisoformat(json.load(f)['last_update'])
-                return (datetime.utcnow() - lastupd).days > self.threshold
-        else:
+        lastupd = await _cache.read_last_update(str(fpath))
+        if lastupd is None:
             return True
+        return (datetime.now(timezone.utc) - lastupd).days > self.threshold
 
 
 @singleton
 class KowloonMotorBus(Transport):
     __path_prefix__ = "kmb"
 
+    _max_concurrency = 20
+    """Maximum number of in-flight API requests of a fetch"""
+
     _bound_map = {
         'O': enums.Direction.OUTBOUND.value,
         'I': enums.Direction.INBOUND.value,
@@ -302,79 +395,109 @@ class KowloonMotorBus(Transport):
     def company(self) -> enums.Transport:
         return enums.Transport.KMB
 
-    async def fetch_route_list(self) -> dict:
+    @cached_property
+    def _stop_index(self) -> _cache.ValueCache:
+        """All KMB stops keyed by stop ID, expiring with the data files"""
+        async def fetch(session: aiohttp.ClientSession) -> dict[str, dict]:
+            return {stop['stop']: stop for stop in (await api.kmb_stop_list(session))['data']}
+        return _cache.ValueCache(fetch, ttl=self.threshold * 24 * 60 * 60)
+
+    async def fetch_route_list(self,
+                               session: Optional[aiohttp.ClientSession] = None) -> dict:
         async def fetch_route_details(session: aiohttp.ClientSession,
+                                      sem: asyncio.Semaphore,
                                       stop: dict) -> dict:
             """Fetch the terminal stops details for the `stop`
             """
             direction = self._bound_map[stop['bound']]
-            stop_list = (await api.kmb_route_stop_list(
-                stop['route'], direction, stop['service_type'], session))['data']
+            async with sem:
+                stop_list = (await api.kmb_route_stop_list(
+                    stop['route'], direction, stop['service_type'], session))['data']
             return {
                 'name': stop['route'],
                 'direction': direction,
-                'terminal': {
-                    'route_id': f"{stop['route']}_{direction}_{stop['service_type']}",
-                    'service_type': stop['service_type'],
-                    'orig': {
-                        'stop_code': stop_list[0]['stop'],
-                        'seq': int(stop_list[0]['seq']),
-                        'name': {
-                            enums.Locale.EN.value: stop.get('orig_en', "N/A"),
-                            enums.Locale.TC.value:  stop.get('orig_tc', "未有資料"),
-                        }
-                    },
-                    'dest': {
-                        'stop_code': stop_list[-1]['stop'],
-                        'seq': int(stop_list[-1]['seq']),
-                        'name': {
-                            enums.Locale.EN.value: stop.get('dest_en', "N/A"),
-                            enums.Locale.TC.value:  stop.get('dest_tc', "未有資料"),
-                        }
-                    }
-                }
+                'terminal': models.RouteEndpoints(
+                    route_id=f"{stop['route']}_{direction}_{stop['service_type']}",
+                    service_type=stop['service_type'],
+                    orig=models.StopPoint(
+                        stop_code=stop_list[0]['stop'],
+                        seq=int(stop_list[0]['seq']),
+                        name=models.LocalizedName(
+                            tc=stop.get('orig_tc', "未有資料"),
+                            en=stop.get('orig_en', "N/A"),
+                        )
+                    ),
+                    dest=models.StopPoint(
+                        stop_code=stop_list[-1]['stop'],
+                        seq=int(stop_list[-1]['seq']),
+                        name=models.LocalizedName(
+                            tc=stop.get('dest_tc', "未有資料"),
+                            en=stop.get('dest_en', "N/A"),
+                        )
+                    )
+                )
             }
 
-        route_list = {}
-        async with aiohttp.ClientSession() as session:
-            tasks = (fetch_route_details(session, stop)
-                     for stop in (await api.kmb_route_list(session))['data'])
-
-            for route in await asyncio.gather(*tasks):
-                # route name
-                route_list.setdefault(
-                    route['name'], {'inbound': [], 'outbound': []})
-                # service type
-                route_list[route['name']][route['direction']].append(
-                    route['terminal'])
+        if session is None:
+            session = api.get_session()
+
+        stops = (await api.kmb_route_list(session))['data']
+        # keep the routes in the order of the API response
+        route_list = {stop['route']: models.RouteDirection() for stop in stops}
+        sem = asyncio.Semaphore(self._max_concurrency)
+        tasks = [fetch_route_details(session, sem, stop) for stop in stops]
+
+        # aggregate each route as soon as it is fetched
+        for task in asyncio.as_completed(tasks):
+            route = await task
+            # route name -> direction -> service type
+            getattr(route_list[route['name']], route['direction']).append(
+                route['terminal'])
+
+        for direction in route_list.values():
+            for endpoints in (direction.inbound, direction.outbound):
+                endpoints.sort(key=lambda e: int(e.service_type))
         return route_list
 
     async def fetch_stop_list(self,
                               route_no: str,
                               direction: enums.Direction,
-                              service_type: str) -> dict:
-        if route_no not in self.routes.keys():
+                              service_type: str,
+                              session: Optional[aiohttp.ClientSession] = None
+                              ) -> list[models.StopPoint]:
+        if route_no not in (await self.load_routes()).keys():
             raise exceptions.RouteNotExist(route_no)
 
-        async def fetch_stop_details(session: aiohttp.ClientSession, stop: dict):
+        async def fetch_stop_details(session: aiohttp.ClientSession,
+                                     sem: asyncio.Semaphore,
+                                     stop_index: dict[str, dict],
+                                     stop: dict):
             """Fetch `stop_code`, `seq`, `name` of the 'stop'
             """
-            dets = (await api.kmb_stop_details(stop['stop'], session))['data']
-            return {
-                'stop_code': stop['stop'],
-                'seq': stop['seq'],
-                'name': {
-                    enums.Locale.TC.value: dets.get('name_tc'),
-                    enums.Locale.EN.value: dets.get('name_en'),
-                }
-            }
-
-        async with aiohttp.ClientSession() as session:
-            stop_list = await api.kmb_route_stop_list(
-                route_no, direction.value, service_type, session)
-
-            stops = await asyncio.gather(
-                *[fetch_stop_details(session, stop) for stop in stop_list['data']])
+            dets = stop_index.get(stop['stop'])
+            if dets is None:
+                # stop added after the stop list is cached
+                async with sem:
+                    dets = (await _KMB_STOP_DETAILS.get(stop['stop'], session))['data']
+            return models.StopPoint(
+                stop_code=stop['stop'],
+                seq=int(stop['seq']),
+                name=models.LocalizedName(
+                    tc=dets.get('name_tc', "未有資料"),
+                    en=dets.get('name_en', "N/A"),
+                )
+            )
+
+        if session is None:
+            session = api.get_session()
+
+        stop_list, stop_index = await asyncio.gather(
+            api.kmb_route_stop_list(route_no, direction.value, service_type, session),
+            self._stop_index.get(session))
+
+        sem = asyncio.Semaphore(self._max_concurrency)
+        stops = await asyncio.gather(
+            *[fetch_stop_details(session, sem, stop_index, stop) for stop in stop_list['data']])
         if len(stops) == 0:
             raise exceptions.RouteError(
                 f"{route_no}/{direction.value}/{service_type}")
@@ -398,57 +521,64 @@ class MTRBus(Transport):
     def company(self) -> enums.Transport:
         return enums.Transport.MTRBUS
 
-    async def fetch_route_list(self) -> dict:
-        route_list = {}
-        apidata = csv.reader(await api.mtr_bus_stop_list())
-        next(apidata)  # ignore header line
+    async def fetch_route_list(self,
+                               session: Optional[aiohttp.ClientSession] = None) -> dict:
+        route_list = defaultdict(models.RouteDirection)
+        apidata = await _MTR_BUS_STOPS.groups(session or api.get_session())
+        bound = self._bound_map.__getitem__
 
-        for row in apidata:
+        for (route, code), rows in apidata.items():
             # column definition:
             # route, direction, seq, stopID, stopLAT, stopLONG, stopTCName, stopENName
-            direction = self._bound_map[row[1]]
-            route_list.setdefault(row[0], {'inbound': [], 'outbound': []})
-
-            if row[2] == "1.00" or row[2] == "1":
-                # orignal
-                route_list[row[0]][direction].append({
-                    'route_id': f"{row[0]}_{direction}_default",
-                    'service_type': "default",
-                    'orig': {
-                        'stop_code': row[3],
-                        'seq': int(row[2].strip(".00")),
-                        'name': {enums.Locale.EN: row[7], enums.Locale.TC: row[6]}
-                    },
-                    'dest': {}
-                })
-            else:
+            direction = bound(code)
+            endpoints = getattr(route_list[route], direction)
+            dest = None
+
+            for row in rows:
+                if row[2] == "1.00" or row[2] == "1":
+                    # orignal
+                    endpoints.append(models.RouteEndpoints(
+                        route_id=f"{route}_{direction}_default",
+                        service_type="default",
+                        orig=models.StopPoint(
+                            stop_code=row[3],
+                            seq=int(float(row[2])),
+                            name=models.LocalizedName(tc=row[6], en=row[7])
+                        )
+                    ))
+                else:
+                    dest = row
+
+            if dest is not None:
                 # destination
-                route_list[row[0]][direction][0]['dest'] = {
-                    'stop_code': row[3],
-                    'seq': int(row[2].strip(".00")),
-                    'name': {enums.Locale.EN: row[7], enums.Locale.TC: row[6]}
-                }
-        return route_list
+                endpoints[0].dest = models.StopPoint(
+                    stop_code=dest[3],
+                    seq=int(float(dest[2])),
+                    name=models.LocalizedName(tc=dest[6], en=dest[7])
+                )
+        return dict(route_list)
 
     async def fetch_stop_list(self,
                               route_no: str,
                               direction: enums.Direction,
-                              service_type: str) -> dict:
+                              service_type: str,
+                              session: Optional[aiohttp.ClientSession] = None
+                              ) -> list[models.StopPoint]:
         if (service_type != "default"):
             raise exceptions.ServiceTypeNotExist(service_type)
 
-        async with aiohttp.ClientSession() as session:
-            apidata = csv.reader(await api.mtr_bus_stop_list(session))
-
-        stops = [stop for stop in apidata
-                 if stop[0] == route_no and self._bound_map[stop[1]] == direction]
+        routes = await _MTR_BUS_STOPS.groups(session or api.get_session())
+        rows = (stop for code, bound in self._bound_map.items() if bound == direction
+                for stop in routes.get((route_no, code), ()))
+        stops = [models.StopPoint(
+            stop_code=stop[3],
+            seq=int(float(stop[2])),
+            name=models.LocalizedName(tc=stop[6], en=stop[7])
+        ) for stop in rows]
 
         if len(stops) == 0:
             raise exceptions.RouteNotExist(route_no)
-        return [{'stop_code': stop[3],
-                 'seq': int(stop[2].strip(".00")),
-                 'name': {enums.Locale.TC: stop[6], enums.Locale.EN: stop[7]}
-                 } for stop in stops]
+        return stops
 
     def logo(self) -> io.BufferedReader:
         return open(os.path.join(_DIRLOGO, "mtr_bus.bmp"), "rb")
@@ -468,57 +598,66 @@ class MTRLightRail(Transport):
     def company(self) -> enums.Transport:
         return enums.Transport.MTRLRT
 
-    async def fetch_route_list(self) -> dict:
-        route_list = {}
-        apidata = csv.reader(await api.mtr_lrt_route_stop_list())
-        next(apidata)  # ignore the header line
+    async def fetch_route_list(self,
+                               session: Optional[aiohttp.ClientSession] = None) -> dict:
+        route_list = defaultdict(models.RouteDirection)
+        apidata = await _MTR_LRT_STOPS.groups(session or api.get_session())
+        bound = self._bound_map.__getitem__
 
-        for row in apidata:
+        for (route, code), rows in apidata.items():
             # column definition:
             # route, direction , stopCode, stopID, stopTCName, stopENName, seq
-            direction = self._bound_map[row[1]]
-            route_list.setdefault(row[0], {'inbound': [], 'outbound': []})
-
-            if (row[6] == "1.00"):
-                # original
-                route_list[row[0]][direction].append({
-                    'route_id': f"{row[0]}_{direction}_default",
-                    'service_type': "default",
-                    'orig': {
-                        'stop_code': row[3],
-                        'seq': row[6],
-                        'name': {enums.Locale.EN: row[5], enums.Locale.TC: row[4]}
-                    },
-                    'dest': {}
-                })
-            else:
+            direction = bound(code)
+            endpoints = getattr(route_list[route], direction)
+            dest = None
+
+            for row in rows:
+                if (row[6] == "1.00"):
+                    # original
+                    endpoints.append(models.RouteEndpoints(
+                        route_id=f"{route}_{direction}_default",
+                        service_type="default",
+                        orig=models.StopPoint(
+                            stop_code=row[3],
+                            seq=int(float(row[6])),
+                            name=models.LocalizedName(tc=row[4], en=row[5])
+                        )
+                    ))
+                else:
+                    dest = row
+
+            if dest is not None:
                 # destination
-                route_list[row[0]][direction][0]['dest'] = {
-                    'stop_code': row[3],
-                    'seq': row[6],
-                    'name': {enums.Locale.EN.value: row[5], enums.Locale.TC.value: row[4]}
-                }
-        return route_list
+                endpoints[0].dest = models.StopPoint(
+                    stop_code=dest[3],
+                    seq=int(float(dest[6])),
+                    name=models.LocalizedName(tc=dest[4], en=dest[5])
+                )
+        return dict(route_list)
 
     async def fetch_stop_list(self,
                               route_no: str,
                               direction: enums.Direction,
-                              service_type: str) -> dict:
+                              service_type: str,
+                              session: Optional[aiohttp.ClientSession] = None
+                              ) -> list[models.StopPoint]:
         if (service_type != "default"):
             raise exceptions.ServiceTypeNotExist(service_type)
-        if route_no not in self.routes.keys():
+        if route_no not in (await self.load_routes()).keys():
             raise exceptions.RouteNotExist(route_no)
 
-        apidata = csv.reader(await api.mtr_lrt_route_stop_list())
-        stops = [stop for stop in apidata
-                 if stop[0] == route_no and self._bound_map[stop[1]] == direction]
+        routes = await _MTR_LRT_STOPS.groups(session or api.get_session())
+        rows = (stop for code, bound in self._bound_map.items() if bound == direction
+                for stop in routes.get((route_no, code), ()))
+        stops = [models.StopPoint(
+            stop_code=stop[3],
+            seq=int(float(stop[6])),
+            name=models.LocalizedName(tc=stop[4], en=stop[5])
+        ) for stop in rows]
 
         if len(stops) == 0:
             raise exceptions.RouteNotExist(route_no)
-        return [{'stop_code': stop[3],
-                 'seq': int(stop[6].strip('.00')),
-                 'name': {enums.Locale.TC.value: stop[4], enums.Locale.EN.value: stop[5]}
-                 } for stop in stops]
+        return stops
 
     def logo(self) -> io.BufferedReader:
         return open(os.path.join(_DIRLOGO, "mtr_lrt.bmp"), "rb")
@@ -538,75 +677,76 @@ class MTRTrain(Transport):
     def company(self) -> enums.Transport:
         return enums.Transport.MTRTRAIN
 
-    async def fetch_route_list(self) -> dict:
-        route_list = {}
-        apidata = csv.reader(await api.mtr_train_route_stop_list())
-        next(apidata)  # ignore header line
+    async def fetch_route_list(self,
+                               session: Optional[aiohttp.ClientSession] = None) -> dict:
+        route_list = defaultdict(models.RouteDirection)
+        apidata = await _MTR_TRAIN_STOPS.groups(session or api.get_session())
+        bound = self._bound_map.__getitem__
 
-        for row in apidata:
+        for (line, code), rows in apidata.items():
             # column definition:
             # Line Code, Direction, Station Code, Station ID, Chinese Name, English Name, Sequence
-            if not any(row):  # skip empty row
-                continue
-
-            direction, _, rt_type = row[1].partition("-")
+            direction, _, rt_type = code.partition("-")
             if rt_type:
                 # route with multiple origin/destination
                 direction, rt_type = rt_type, direction  # e.g. LMC-DT
                 # make a "new line" for these type of route
-                row[0] += f"-{rt_type}"
-            direction = self._bound_map[direction]
-            route_list.setdefault(row[0], {'inbound': [], 'outbound': []})
-
-            if (row[6] == "1.00"):
-                # origin
-                route_list[row[0]][direction].append({
-                    'route_id': f"{row[0]}_{direction}_default",
-                    'service_type': "default",
-                    'orig': {
-                        'stop_code': row[2],
-                        'seq': int(row[6].strip(".00")),
-                        'name': {enums.Locale.EN.value: row[5], enums.Locale.TC.value: row[4]}
-                    },
-                    'dest': {}
-                })
-            else:
+                line += f"-{rt_type}"
+            direction = bound(direction)
+            endpoints = getattr(route_list[line], direction)
+            dest = None
+
+            for row in rows:
+                if (row[6] == "1.00"):
+                    # origin
+                    endpoints.append(models.RouteEndpoints(
+                        route_id=f"{line}_{direction}_default",
+                        service_type="default",
+                        orig=models.StopPoint(
+                            stop_code=row[2],
+                            seq=int(float(row[6])),
+                            name=models.LocalizedName(tc=row[4], en=row[5])
+                        )
+                    ))
+                else:
+                    dest = row
+
+            if dest is not None:
                 # destination
-                route_list[row[0]][direction][0]['dest'] = {
-                    'stop_code': row[2],
-                    'seq': int(row[6].strip(".00")),
-                    'name': {enums.Locale.EN.value: row[5], enums.Locale.TC.value: row[4]}
-                }
-        return route_list
+                endpoints[0].dest = models.StopPoint(
+                    stop_code=dest[2],
+                    seq=int(float(dest[6])),
+                    name=models.LocalizedName(tc=dest[4], en=dest[5])
+                )
+        return dict(route_list)
 
     async def fetch_stop_list(self,
                               route_no: str,
                               direction: enums.Direction,
-                              service_type: str) -> dict:
+                              service_type: str,
+                              session: Optional[aiohttp.ClientSession] = None
+                              ) -> list[models.StopPoint]:
         if (service_type != "default"):
             raise exceptions.ServiceTypeNotExist(service_type)
-        if route_no not in self.routes.keys():
+        if route_no not in (await self.load_routes()).keys():
             raise exceptions.RouteNotExist(route_no)
 
-        apidata = csv.reader(await api.mtr_train_route_stop_list())
+        routes = await _MTR_TRAIN_STOPS.groups(session or api.get_session())
 
-        if "-" in route_no:
-            # route with multiple origin/destination (e.g. EAL-LMC)
-            rt_name, rt_type = route_no.split("-")
-            stops = [stop for stop in apidata
-                     if stop[0] == rt_name and rt_type in stop[1]]
-        else:
-            stops = [stop for stop in apidata
-                     if stop[0] == route_no
-                     and self._bound_map[stop[1].split("-")[-1]] == direction]
-            # stop[1] (direction) could contain not just the direction (e.g. LMC-DT)
+        # direction of route with multiple origin/destination is prefixed (e.g. LMC-DT)
+        rt_name, _, rt_type = route_no.partition("-")
+        prefix = f"{rt_type}-" if rt_type else ""
+        rows = (stop for code, bound in self._bound_map.items() if bound == direction
+                for stop in routes.get((rt_name, prefix + code), ()))
 
+        stops = [models.StopPoint(
+            stop_code=stop[2],
+            seq=int(float(stop[-1])),
+            name=models.LocalizedName(tc=stop[4], en=stop[5])
+        ) for stop in rows]
         if len(stops) == 0:
             raise exceptions.RouteNotExist(route_no)
-        return [{'stop_code': stop[2],
-                 'seq': int(stop[-1].strip('.00')),
-                 'name': {enums.Locale.TC.value: stop[4], enums.Locale.EN.value: stop[5]}
-                 } for stop in stops]
+        return stops
 
     def logo(self) -> io.BufferedReader:
         return open(os.path.join(_DIRLOGO, "mtr_train.bmp"), "rb")
@@ -616,94 +756,111 @@ class MTRTrain(Transport):
 class CityBus(Transport):
     __path_prefix__ = 'ctb'
 
+    _max_concurrency = 20
+    """Maximum number of in-flight API requests of a fetch"""
+
     @property
     def company(self) -> enums.Transport:
         return enums.Transport.CTB
 
-    async def fetch_route_list(self) -> dict:
+    async def fetch_route_list(self,
+                               session: Optional[aiohttp.ClientSession] = None) -> dict:
         async def fetch_route_details(session: aiohttp.ClientSession,
-                                      route: dict) -> dict:
+                                      sem: asyncio.Semaphore,
+                                      route: dict) -> tuple[str, models.RouteDirection]:
             """Fetch the terminal stops details (all direction) for the `route`
             """
-            directions = {
-                'inbound': (await api.bravobus_route_stop_list(
-                    "ctb", route['route'], "inbound", session))['data'],
-                'outbound': (await api.bravobus_route_stop_list(
-                    "ctb", route['route'], "outbound", session))['data']
-            }
-
-            routes = {route['route']: {'inbound': [], 'outbound': []}}
-            for direction, stop_list in directions.items():
-                if len(stop_list) == 0:
-                    continue
-
-                ends = await asyncio.gather(*[
-                    api.bravobus_stop_details(stop_list[0]['stop']),
-                    api.bravobus_stop_details(stop_list[-1]['stop'])
+            async with sem:
+                inbound, outbound = await asyncio.gather(
+                    api.bravobus_route_stop_list("ctb", route['route'], "inbound", session),
+                    api.bravobus_route_stop_list("ctb", route['route'], "outbound", session))
+                directions = {direction: stop_list for direction, stop_list
+                              in (('inbound', inbound['data']), ('outbound', outbound['data']))
+                              if len(stop_list) > 0}
+
+                details = await asyncio.gather(*[
+                    _CTB_STOP_DETAILS.get(stop_list[idx]['stop'], session)
+                    for stop_list in directions.values() for idx in (0, -1)
                 ])
 
-                routes[route['route']][direction] = [{
-                    'route_id': f"{route['route']}_{direction}_default",
-                    'service_type': "default",
-                    'orig': {
-                        'stop_code': stop_list[0]['stop'],
-                        'seq': stop_list[0]['seq'],
-                        'name': {
-                            enums.Locale.EN.value: ends[0]['data'].get('name_en', "N/A"),
-                            enums.Locale.TC.value:  ends[0]['data'].get('name_tc', "未有資料"),
-                        }
-                    },
-                    'dest': {
-                        'stop_code': stop_list[-1]['stop'],
-                        'seq': stop_list[-1]['seq'],
-                        'name': {
-                            enums.Locale.EN.value: ends[-1]['data'].get('name_en', "N/A"),
-                            enums.Locale.TC.value:  ends[-1]['data'].get('name_tc', "未有資料"),
-                        }
-                    }
-                }]
-            return routes
-
-        async with aiohttp.ClientSession() as session:
-            tasks = [fetch_route_details(session, stop) for stop in
-                     (await api.bravobus_route_list("ctb", session))['data']]
-
-            # keys()[0] = route name
-            return {list(route.keys())[0]: route[list(route.keys())[0]]
-                    for route in await asyncio.gather(*tasks)}
+            route_dets = models.RouteDirection()
+            for (direction, stop_list), ends in zip(
+                    directions.items(), zip(details[::2], details[1::2])):
+                setattr(route_dets, direction, [models.RouteEndpoints(
+                    route_id=f"{route['route']}_{direction}_default",
+                    service_type="default",
+                    orig=models.StopPoint(
+                        stop_code=stop_list[0]['stop'],
+                        seq=int(stop_list[0]['seq']),
+                        name=models.LocalizedName(
+                            tc=ends[0]['data'].get('name_tc', "未有資料"),
+                            en=ends[0]['data'].get('name_en', "N/A"),
+                        )
+                    ),
+                    dest=models.StopPoint(
+                        stop_code=stop_list[-1]['stop'],
+                        seq=int(stop_list[-1]['seq']),
+                        name=models.LocalizedName(
+                            tc=ends[-1]['data'].get('name_tc', "未有資料"),
+                            en=ends[-1]['data'].get('name_en', "N/A"),
+                        )
+                    )
+                )])
+            return route['route'], route_dets
+
+        if session is None:
+            session = api.get_session()
+
+        routes = (await api.bravobus_route_list("ctb", session))['data']
+        # keep the routes in the order of the API response
+        route_list = dict.fromkeys(route['route'] for route in routes)
+        sem = asyncio.Semaphore(self._max_concurrency)
+        tasks = [fetch_route_details(session, sem, route) for route in routes]
+
+        # aggregate each route as soon as it is fetched
+        for task in asyncio.as_completed(tasks):
+            route_no, route_dets = await task
+            route_list[route_no] = route_dets
+        return route_list
 
     async def fetch_stop_list(self,
                               route_no: str,
                               direction: enums.Direction,
-                              service_type: str) -> dict:
+                              service_type: str,
+                              session: Optional[aiohttp.ClientSession] = None
+                              ) -> list[models.StopPoint]:
         if (service_type != "default"):
             raise exceptions.ServiceTypeNotExist(service_type)
-        if route_no not in self.routes.keys():
+        if route_no not in (await self.load_routes()).keys():
             raise exceptions.RouteNotExist(route_no)
 
         async def fetch_stop_details(session: aiohttp.ClientSession, stop: dict):
             """Fetch `stop_code`, `seq`, `name` of the 'stop'
             """
-            dets = (await api.bravobus_stop_details(stop['stop'], session))['data']
-            return {
-                'stop_code': stop['stop'],
-                'seq': int(stop['seq']),
-                'name': {
-                    enums.Locale.EN.value: dets.get('name_en', "N/A"),
-                    enums.Locale.TC.value: dets.get('name_tc', "未有資料")
-                }
-            }
-
-        async with aiohttp.ClientSession() as session:
-            stop_list = await api.bravobus_route_stop_list(
-                "ctb", route_no, direction.value, session)
-
-            stop_list = await asyncio.gather(
-                *[fetch_stop_details(session, stop) for stop in stop_list['data']])
-
-            if len(stop_list) == 0:
-                raise exceptions.RouteNotExist(route_no)
-            return stop_list
+            async with sem:
+                dets = (await _CTB_STOP_DETAILS.get(stop['stop'], session))['data']
+            return models.StopPoint(
+                stop_code=stop['stop'],
+                seq=int(stop['seq']),
+                name=models.LocalizedName(
+                    tc=dets.get('name_tc', "未有資料"),
+                    en=dets.get('name_en', "N/A"),
+                )
+            )
+
+        if session is None:
+            session = api.get_session()
+
+        stop_list = await api.bravobus_route_stop_list(
+            "ctb", route_no, direction.value, session)
+
+        sem = asyncio.Semaphore(self._max_concurrency)
+        stop_list = await asyncio.gather(
+            *[fetch_stop_details(session, stop) for stop in stop_list['data']])
+
+        if len(stop_list) == 0:
+            raise exceptions.RouteNotExist(route_no)
+        return stop_list
 
     def logo(self) -> io.BufferedReader:
         return open(os.path.join(_DIRLOGO, "ctb.bmp"), "rb")
@@ -718,8 +875,9 @@ class NewLantaoBus(Transport):
     def company(self) -> enums.Transport:
         return enums.Transport.NLB
 
-    async def fetch_route_list(self) -> dict:
-        output = {}
+    async def fetch_route_list(self,
+                               session: Optional[aiohttp.ClientSession] = None) -> dict:
+        output = defaultdict(models.RouteDirection)
 
         async def fetch_route_details(route: dict, session: aiohttp.ClientSession):
             """Return the origin and destination details of a route.
@@ -728,69 +886,72 @@ class NewLantaoBus(Transport):
             return {
                 "route_no": route['routeNo'],
                 "route_id": route['routeId'],
-                "orig": {
-                    "stop_code": stops[0]['stopId'],
-                    "seq": 1,
-                    "name": {"en": stops[0]['stopName_e'], "tc": stops[0]['stopName_c']}
-                },
-                "dest": {
-                    "stop_code": stops[-1]['stopId'],
-                    "seq": len(stops),
-                    "name": {"en": stops[-1]['stopName_e'], "tc": stops[-1]['stopName_c']}
-                }
+                "orig": models.StopPoint(
+                    stop_code=stops[0]['stopId'],
+                    seq=1,
+                    name=models.LocalizedName(tc=stops[0]['stopName_c'], en=stops[0]['stopName_e'])
+                ),
+                "dest": models.StopPoint(
+                    stop_code=stops[-1]['stopId'],
+                    seq=len(stops),
+                    name=models.LocalizedName(
+                        tc=stops[-1]['stopName_c'],
+                        en=stops[-1]['stopName_e'],
+                    )
+                )
             }
 
         # normal routes usually comes before speical routes
         # need to be sorted by routeId to store the default server_type properly
-        async with aiohttp.ClientSession() as s:
-            routes = await asyncio.gather(
-                *[fetch_route_details(r, s) for r in
-                  sorted((await api.nlb_route_list(s))['routes'],
-                         key=cmp_to_key(lambda a, b: int(a['routeId']) - int(b['routeId'])))])
+        if session is None:
+            session = api.get_session()
+
+        routes = await asyncio.gather(
+            *[fetch_route_details(r, session) for r in
+              sorted((await api.nlb_route_list(session))['routes'],
+                     key=cmp_to_key(lambda a, b: int(a['routeId']) - int(b['routeId'])))])
 
         for route in routes:
             route_no = route['route_no']
-            output.setdefault(route_no, {'outbound': [], 'inbound': []})
+            bounds = output[route_no]
 
             service_type = '1'
-            direction = 'inbound' if len(
-                output[route_no]['outbound']) else 'outbound'
+            direction = 'inbound' if len(bounds.outbound) else 'outbound'
 
             # since the routes already sorted by ID, we can assume that
-            # when both the `outbound` and `inbound` have data, it is a special route.
-            if all(len(b) for b in output[route_no]):
-                _join = {
-                    **{'outbound': output[route_no]['outbound']},
-                    **{'inbound': output[route_no]['inbound']}
-                }
+            # a route seen before (in either direction) is the parent of a special route.
+            if bounds.outbound or bounds.inbound:
+                _join = {'outbound': bounds.outbound, 'inbound': bounds.inbound}
                 for bound, parent_rt in _join.items():
                     for r in parent_rt:
                         # special routes usually diff from either orig or dest stop
-                        if (r['orig']['name']['en'] == route['orig']['name']['en']
-                                or r['dest']['name']['en'] == route['dest']['name']['en']):
+                        if (r.orig.name.en == route['orig'].name.en
+                                or r.dest.name.en == route['dest'].name.en):
                             direction = bound
                             service_type = str(
-                                len(output[route_no][direction]) + 1)
+                                len(getattr(bounds, direction)) + 1)
                             break
                     else:
                         continue
                     break
 
-            output[route_no][direction].append({
-                "route_id": route['route_id'],
-                "service_type": service_type,
-                "orig": route['orig'],
-                "dest": route['dest'],
-            })
+            getattr(bounds, direction).append(models.RouteEndpoints(
+                route_id=route['route_id'],
+                service_type=service_type,
+                orig=route['orig'],
+                dest=route['dest'],
+            ))
 
-        return output
+        return dict(output)
 
     async def fetch_stop_list(self,
                               route_no: str,
                               direction: enums.Direction,
-                              service_type: str) -> list[dict[str, Any]]:
+                              service_type: str,
+                              session: Optional[aiohttp.ClientSession] = None
+                              ) -> list[models.StopPoint]:
         # TODO: service type checking
-        if route_no not in self.routes.keys():
+        if route_no not in (await self.load_routes()).keys():
             raise exceptions.RouteNotExist(route_no)
 
         if isinstance(direction, str):
@@ -800,14 +961,15 @@ class NewLantaoBus(Transport):
             .service_lookup(direction, service_type) \
             .route_id
 
-        return [{
-            'stop_code': stop['stopId'],
-            'seq': idx,
-            'name': {
-                enums.Locale.TC.value: stop['stopName_c'],
-                enums.Locale.EN.value: stop['stopName_e'],
-            }} for idx, stop in enumerate((await api.nlb_route_stop_list(route_id))['stops'],
-                                          start=1)
+        return [models.StopPoint(
+            stop_code=stop['stopId'],
+            seq=idx,
+            name=models.LocalizedName(
+                tc=stop['stopName_c'],
+                en=stop['stopName_e'],
+            )) for idx, stop in enumerate(
+                (await api.nlb_route_stop_list(route_id, session or api.get_session()))['stops'],
+                start=1)
         ]
 
     def logo(self) -> io.BufferedReader:
@@ -11,15 +11,15 @@ router = APIRouter(prefix="")
 
 
 @router.get("/eta/{company}/{route_no}")
-def get_eta(company: hketa.enums.Transport,
-            route_no: str,
-            direction: hketa.enums.Direction,
-            stop_code: str,
-            service_type: str,
-            lang: hketa.enums.Locale = hketa.enums.Locale.TC):
+async def get_eta(company: hketa.enums.Transport,
+                  route_no: str,
+                  direction: hketa.enums.Direction,
+                  stop_code: str,
+                  service_type: str,
+                  lang: hketa.enums.Locale = hketa.enums.Locale.TC):
 
     try:
-        provider = definition.ETA_FACTORY.create_eta_processor(
+        provider = await definition.ETA_FACTORY.create_eta_processor(
             hketa.models.RouteEntry(
                 company=company, no=route_no, direction=direction,
                 stop=stop_code, service_type=service_type, lang=lang,)
@@ -61,7 +61,7 @@ def get_eta(company: hketa.enums.Transport,
         return std_response.StdResponse.success_(
             data={
                 **info,
-                'etas': provider.etas(),
+                'etas': await provider.etas(),
             }
         )
     except hketa.exceptions.EmptyEta:
@@ -1,19 +1,50 @@
+from email.utils import formatdate
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Optional
 
-from fastapi import APIRouter
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
 from app.src.models import std_response
 
 from app.src.modules import hketa
 
 router = APIRouter(prefix="")
 
+_LOGO_DIR = Path(__file__).parent.parent.parent.joinpath('static', 'logos')
+
+_LOGOS: dict[tuple[hketa.enums.Transport, str], tuple[bytes, dict[str, str]]] = {}
+"""Logo content and response headers keyed by (company, color)"""
+
+
+def _logo(company: hketa.enums.Transport, color: str) -> Optional[tuple[bytes, dict[str, str]]]:
+    """Read the logo of `company` and its response headers, `None` if it does not exist.
+
+    Existing logos are read once and kept in memory.
+    """
+    key = (company, color)
+    if key not in _LOGOS:
+        path = _LOGO_DIR.joinpath(color, f'{company.value}.bmp')
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        _LOGOS[key] = (path.read_bytes(), {
+            'ETag': f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+            'Last-Modified': formatdate(stat.st_mtime, usegmt=True),
+            'Cache-Control': 'public, max-age=86400',
+        })
+    return _LOGOS[key]
+
 
 @router.get("/{company}/{color}/icon")
-def company_icon(company: hketa.enums.Transport, color: Literal['bw', 'c', 'bw_neg']):
-    path = Path(__file__).parent.parent.parent.joinpath(
-        'static', 'logos', color, f'{company.value}.bmp')
-    if not path.exists():
+async def company_icon(request: Request,
+                       company: hketa.enums.Transport,
+                       color: Literal['bw', 'c', 'bw_neg']):
+    logo = _logo(company, color)
+    if logo is None:
         return std_response.StdResponse.fail(message="File not exists.")
-    return FileResponse(path)
+
+    content, headers = logo
+    if request.headers.get('if-none-match') == headers['ETag']:
+        return Response(status_code=304, headers=headers)
+    return Response(content, media_type="image/bmp", headers=headers)
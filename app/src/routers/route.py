@@ -11,14 +11,14 @@ router = APIRouter()
 
 
 @router.get("/routes/{company}")
-def get_route_list(company: hketa.enums.Transport,
-                   route_no: Optional[str] = None,
-                   service_type: Optional[str | int] = None,
-                   terminal_name: Optional[str] = None,
-                   ) -> std_response.StdResponse:
-    route_list = definition.ETA_FACTORY \
-        .create_transport(company) \
-        .route_list()
+async def get_route_list(company: hketa.enums.Transport,
+                         route_no: Optional[str] = None,
+                         service_type: Optional[str | int] = None,
+                         terminal_name: Optional[str] = None,
+                         ) -> std_response.StdResponse:
+    route_list = await (definition.ETA_FACTORY
+                        .create_transport(company)
+                        .route_list())
 
     if route_no:
         route_list = {route_no: route_list[route_no]}
@@ -47,24 +47,21 @@ def get_route_list(company: hketa.enums.Transport,
 
 
 @router.get("/services/{company}/{route_no}")
-def get_route_details(company: hketa.enums.Transport,
-                      route_no: str = None,
-                      ) -> std_response.StdResponse:
-    route_list = definition.ETA_FACTORY \
-        .create_transport(company) \
-        .route_list()
-
-    if route_no not in route_list.keys():
-        # TODO: handle route not exists
-        pass
-    return std_response.StdResponse.success_(data=asdict(route_list[route_no.upper()]))
+async def get_route_details(company: hketa.enums.Transport,
+                            route_no: str = None,
+                            ) -> std_response.StdResponse:
+    # TODO: handle route not exists
+    route = await (definition.ETA_FACTORY
+                   .create_transport(company)
+                   .route_meta(route_no.upper()))
+    return std_response.StdResponse.success_(data=asdict(route))
 
 
 @router.get("/stops/{company}/{route_no}")
-def get_stop_list(company: hketa.enums.Transport,
-                  route_no: str,
-                  direction: hketa.enums.Direction,
-                  service_type: str) -> std_response.StdResponse:
+async def get_stop_list(company: hketa.enums.Transport,
+                        route_no: str,
+                        direction: hketa.enums.Direction,
+                        service_type: str) -> std_response.StdResponse:
     transport_ = definition.ETA_FACTORY.create_transport(company)
     return std_response.StdResponse.success_(
         data={
@@ -72,20 +69,20 @@ def get_stop_list(company: hketa.enums.Transport,
             'route_no': route_no,
             'direction': direction,
             'service_type': service_type,
-            'stops': transport_.stop_list(route_no, direction, service_type)
+            'stops': await transport_.stop_list(route_no, direction, service_type)
         }
     )
 
 
 @router.get("/stop/{company}/{route_no}")
-def get_stop(company: hketa.enums.Transport,
-             route_no: str,
-             direction: hketa.enums.Direction,
-             service_type: str,
-             stop_code: str) -> std_response.StdResponse:
-    stop_list = definition.ETA_FACTORY \
-        .create_transport(company) \
-        .stop_list(route_no, direction, service_type)
+async def get_stop(company: hketa.enums.Transport,
+                   route_no: str,
+                   direction: hketa.enums.Direction,
+                   service_type: str,
+                   stop_code: str) -> std_response.StdResponse:
+    stop_list = await (definition.ETA_FACTORY
+                       .create_transport(company)
+                       .stop_list(route_no, direction, service_type))
 
     for stop in stop_list:
         if stop.stop_code == stop_code: